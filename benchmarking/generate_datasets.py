@@ -3,76 +3,114 @@ Dataset Generator for All Problems
 Generates synthetic test instances with varying sizes
 """
 
-import random
 import pickle
 import os
-from typing import List, Set, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import List, Set, Dict, Tuple, Iterator
 
+import numpy as np
+from scipy import sparse
 
-def generate_3sat_instance(n_vars: int, n_clauses: int, seed: int = None) -> List[List[int]]:
-    """Generate random 3-SAT instance"""
-    if seed is not None:
-        random.seed(seed)
-    
-    clauses = []
-    for _ in range(n_clauses):
-        # Pick 3 distinct variables
-        vars_in_clause = random.sample(range(1, n_vars + 1), 3)
-        # Randomly negate each variable
-        clause = [v if random.random() < 0.5 else -v for v in vars_in_clause]
-        clauses.append(clause)
+
+def generate_3sat_instances(n_vars: int, n_clauses: int, n_instances: int, rng: np.random.Generator) -> List[List[List[int]]]:
+    """Generate a batch of random 3-SAT instances from one RNG stream"""
+    # Pick 3 distinct variables per clause: the 3 smallest keys of a random row
+    keys = rng.random((n_instances, n_clauses, n_vars))
+    vars_mat = np.argpartition(keys, 2, axis=2)[:, :, :3] + 1
+    # Randomly negate each variable
+    signs = rng.choice([-1, 1], size=(n_instances, n_clauses, 3))
     
-    return clauses
+    return (vars_mat * signs).tolist()
 
 
-def generate_graph(n_vertices: int, edge_probability: float, seed: int = None) -> Dict[int, Set[int]]:
+def generate_3sat_instance(n_vars: int, n_clauses: int, rng: np.random.Generator) -> List[List[int]]:
+    """Generate random 3-SAT instance"""
+    return generate_3sat_instances(n_vars, n_clauses, 1, rng)[0]
+
+
+def generate_graph_csr(n_vertices: int, edge_probability: float, rng: np.random.Generator) -> sparse.csr_matrix:
+    """Generate random Erdős-Rényi graph as a symmetric boolean CSR adjacency matrix"""
+    # One Bernoulli draw for every vertex pair, keeping the upper triangle
+    mask = np.triu(rng.random((n_vertices, n_vertices)) < edge_probability, 1)
+    return sparse.csr_matrix(mask | mask.T)
+
+
+def generate_graph(n_vertices: int, edge_probability: float, rng: np.random.Generator) -> Dict[int, Set[int]]:
     """Generate random graph using Erdős-Rényi model"""
-    if seed is not None:
-        random.seed(seed)
-    
-    graph = {i: set() for i in range(n_vertices)}
-    
-    for i in range(n_vertices):
-        for j in range(i + 1, n_vertices):
-            if random.random() < edge_probability:
-                graph[i].add(j)
-                graph[j].add(i)
-    
-    return graph
+    return csr_to_graph(generate_graph_csr(n_vertices, edge_probability, rng))
+
+
+def csr_to_graph(adj: sparse.csr_matrix) -> Dict[int, Set[int]]:
+    """Convert CSR adjacency to the adjacency-list form the algorithms take"""
+    indptr, indices = adj.indptr, adj.indices.tolist()
+    return {v: set(indices[indptr[v]:indptr[v + 1]]) for v in range(adj.shape[0])}
 
 
-def generate_set_cover_instance(universe_size: int, num_sets: int, avg_set_size: int, seed: int = None) -> Tuple[Set[int], List[Set[int]]]:
+def generate_set_cover_instance(universe_size: int, num_sets: int, avg_set_size: int, rng: np.random.Generator) -> Tuple[Set[int], List[Set[int]]]:
     """Generate random set cover instance"""
-    if seed is not None:
-        random.seed(seed)
-    
     universe = set(range(universe_size))
     sets = []
     
     for _ in range(num_sets):
         # Vary set size around average
-        set_size = max(1, int(random.gauss(avg_set_size, avg_set_size / 3)))
+        set_size = max(1, int(rng.normal(avg_set_size, avg_set_size / 3)))
         set_size = min(set_size, universe_size)
-        s = set(random.sample(list(universe), set_size))
+        s = set(rng.choice(universe_size, size=set_size, replace=False).tolist())
         sets.append(s)
     
     return universe, sets
 
 
-def generate_all_datasets(output_dir: str = 'datasets'):
-    """Generate all benchmark datasets"""
-    os.makedirs(output_dir, exist_ok=True)
-    
-    datasets = {
-        '3sat': [],
-        'vertex_cover': [],
-        'max_clique': [],
-        'graph_coloring': [],
-        'set_cover': []
+def _make_sat(args: Tuple) -> List[Dict]:
+    """Build all 3-SAT dataset entries of one size (top-level so it can run in a worker process)"""
+    n_vars, n_clauses, size, n_instances = args
+    # One RNG stream per size config, seeded from the config itself
+    batch = generate_3sat_instances(n_vars, n_clauses, n_instances, np.random.default_rng([1000, n_vars, n_clauses]))
+    return [{
+        'name': f'{size}_{i+1}',
+        'n_vars': n_vars,
+        'n_clauses': n_clauses,
+        'clauses': clauses
+    } for i, clauses in enumerate(batch)]
+
+
+def _make_graph(args: Tuple) -> Dict:
+    """Build one graph dataset entry (top-level so it can run in a worker process)"""
+    n_vertices, edge_prob, size, i = args
+    csr = generate_graph_csr(n_vertices, edge_prob, np.random.default_rng(2000 + i))
+    graph = csr_to_graph(csr)
+    return {
+        'name': f'{size}_{i+1}',
+        'n_vertices': n_vertices,
+        'edge_prob': edge_prob,
+        'graph': graph,
+        'csr': csr
+    }
+
+
+def _make_setcover(args: Tuple) -> Dict:
+    """Build one set cover dataset entry (top-level so it can run in a worker process)"""
+    univ_size, num_sets, avg_size, size, i = args
+    universe, sets = generate_set_cover_instance(univ_size, num_sets, avg_size, np.random.default_rng(3000 + i))
+    return {
+        'name': f'{size}_{i+1}',
+        'universe_size': univ_size,
+        'num_sets': num_sets,
+        'universe': universe,
+        'sets': sets
     }
+
+
+def generate_all_datasets(output_dir: str = 'datasets', max_workers: int = None) -> Dict[str, str]:
+    """
+    Generate all benchmark datasets
+    
+    Instances are streamed to disk rather than kept in memory, so this returns
+    {problem: dataset file path}; read a file back with load_datasets.
+    """
+    os.makedirs(output_dir, exist_ok=True)
     
-    # 3-SAT instances
-    print("Generating 3-SAT instances...")
     sat_configs = [
         (5, 10, 'tiny'),
         (7, 18, 'small'),
@@ -83,18 +121,6 @@ def generate_all_datasets(output_dir: str = 'datasets'):
         (17, 60, 'xxlarge'),
         (20, 80, 'huge'),
     ]
-    for n_vars, n_clauses, size in sat_configs:
-        for i in range(2):  # 2 instances per size for faster generation
-            clauses = generate_3sat_instance(n_vars, n_clauses, seed=1000 + i)
-            datasets['3sat'].append({
-                'name': f'{size}_{i+1}',
-                'n_vars': n_vars,
-                'n_clauses': n_clauses,
-                'clauses': clauses
-            })
-    
-    # Vertex Cover / Max Clique / Graph Coloring (same graphs)
-    print("Generating graph instances...")
     graph_configs = [
         (6, 0.5, 'tiny'),
         (8, 0.5, 'small'),
@@ -105,21 +131,6 @@ def generate_all_datasets(output_dir: str = 'datasets'):
         (18, 0.4, 'xxlarge'),
         (22, 0.35, 'huge'),
     ]
-    for n_vertices, edge_prob, size in graph_configs:
-        for i in range(2):
-            graph = generate_graph(n_vertices, edge_prob, seed=2000 + i)
-            graph_data = {
-                'name': f'{size}_{i+1}',
-                'n_vertices': n_vertices,
-                'edge_prob': edge_prob,
-                'graph': graph
-            }
-            datasets['vertex_cover'].append(graph_data.copy())
-            datasets['max_clique'].append(graph_data.copy())
-            datasets['graph_coloring'].append(graph_data.copy())
-    
-    # Set Cover instances
-    print("Generating set cover instances...")
     setcover_configs = [
         (10, 6, 4, 'tiny'),
         (15, 8, 5, 'small'),
@@ -130,28 +141,74 @@ def generate_all_datasets(output_dir: str = 'datasets'):
         (40, 18, 10, 'xxlarge'),
         (50, 22, 12, 'huge'),
     ]
-    for univ_size, num_sets, avg_size, size in setcover_configs:
-        for i in range(2):
-            universe, sets = generate_set_cover_instance(univ_size, num_sets, avg_size, seed=3000 + i)
-            datasets['set_cover'].append({
-                'name': f'{size}_{i+1}',
-                'universe_size': univ_size,
-                'num_sets': num_sets,
-                'universe': universe,
-                'sets': sets
-            })
     
-    # Save datasets
-    for problem, data in datasets.items():
-        filepath = os.path.join(output_dir, f'{problem}_datasets.pkl')
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
-        print(f"Saved {len(data)} instances for {problem}")
+    # 2 instances per size for faster generation; every task is seeded
+    # independently, so they can be built in parallel. 3-SAT instances of one
+    # size come out of a single batched draw from that size's own seed.
+    sat_args = [(*config, 2) for config in sat_configs]
+    graph_args = [(*config, i) for config in graph_configs for i in range(2)]
+    setcover_args = [(*config, i) for config in setcover_configs for i in range(2)]
+    
+    problems = ['3sat', 'vertex_cover', 'max_clique', 'graph_coloring', 'set_cover']
+    counts = {problem: 0 for problem in problems}
+    paths = {problem: os.path.join(output_dir, f'{problem}_datasets.pkl') for problem in problems}
+    
+    with ExitStack() as stack, ProcessPoolExecutor(max_workers=max_workers) as ex:
+        # Stream every instance into its problem file as soon as it is built
+        picklers = {}
+        for problem in problems:
+            f = stack.enter_context(open(paths[problem], 'wb'))
+            picklers[problem] = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        def save(problem: str, instance: Dict):
+            picklers[problem].dump(instance)
+            picklers[problem].clear_memo()  # keep each record self-contained
+            counts[problem] += 1
+        
+        # 3-SAT instances
+        print("Generating 3-SAT instances...")
+        for batch in ex.map(_make_sat, sat_args):
+            for instance in batch:
+                save('3sat', instance)
+        
+        # Vertex Cover / Max Clique / Graph Coloring (same graphs, never mutated
+        # downstream, so the one instance dict is shared)
+        print("Generating graph instances...")
+        for graph_data in ex.map(_make_graph, graph_args):
+            save('vertex_cover', graph_data)
+            save('max_clique', graph_data)
+            save('graph_coloring', graph_data)
+        
+        # Set Cover instances
+        print("Generating set cover instances...")
+        for instance in ex.map(_make_setcover, setcover_args):
+            save('set_cover', instance)
+    
+    for problem, count in counts.items():
+        print(f"Saved {count} instances for {problem}")
     
     print(f"\nAll datasets saved to {output_dir}/")
-    return datasets
+    return paths
+
+
+def load_datasets(filepath: str) -> Iterator[Dict]:
+    """
+    Yield dataset instances one at a time from a file written by generate_all_datasets
+    
+    Files holding a single pickled list (older format) are also accepted.
+    """
+    with open(filepath, 'rb') as f:
+        while True:
+            try:
+                record = pickle.load(f)
+            except EOFError:
+                return
+            if isinstance(record, list):
+                yield from record
+            else:
+                yield record
 
 
 if __name__ == '__main__':
-    datasets = generate_all_datasets()
+    generate_all_datasets()
     print("\n✓ Dataset generation complete!")
@@ -5,382 +5,148 @@ Creates time comparison and accuracy comparison plots
 
 import json
 import os
+import matplotlib
+matplotlib.use('Agg')  # File output only: skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Rectangle
 
+try:
+    import orjson  # Optional: much faster JSON parsing
+except ImportError:
+    orjson = None
 
-def plot_3sat_results(results, output_dir):
-    """Plot 3-SAT benchmark results"""
-    algorithms = ['Bruteforce', 'Randomization', 'Flipping Literals']
-    colors = ['#e74c3c', '#3498db', '#2ecc71']
-    
-    # Extract data
+plt.ioff()
+plt.rcParams['figure.max_open_warning'] = 0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+
+def _metric(results, algorithms, key):
+    """(n_algs, n_instances) float array of one metric; missing/None become NaN, then 0"""
+    raw = [[r['algorithms'].get(alg, {}).get(key) for r in results] for alg in algorithms]
+    return np.nan_to_num(np.array(raw, dtype=np.float64).reshape(len(algorithms), len(results)), nan=0.0)
+
+
+def _extract(results, algorithms):
+    """
+    Collect instance names plus time and accuracy arrays
+    
+    Returns:
+        (instances, times, accuracies) with arrays of shape (n_algs, n_instances);
+        missing values are filled with 0
+    """
     instances = [r['name'] for r in results]
-    times = {alg: [] for alg in algorithms}
-    accuracies = {alg: [] for alg in algorithms}
-    
-    for result in results:
-        for alg in algorithms:
-            if alg in result['algorithms']:
-                time_val = result['algorithms'][alg]['time']
-                acc_val = result['algorithms'][alg]['accuracy']
-                times[alg].append(time_val if time_val is not None else 0)
-                accuracies[alg].append(acc_val if acc_val is not None else 0)
-            else:
-                times[alg].append(0)
-                accuracies[alg].append(0)
-    
-    # Time Comparison Plot
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = np.arange(len(instances))
-    width = 0.25
-    
-    for i, alg in enumerate(algorithms):
-        offset = (i - 1) * width
-        bars = ax.bar(x + offset, times[alg], width, label=alg, color=colors[i], alpha=0.8)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.3f}s',
-                       ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('3-SAT: Time Comparison', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '3sat_time.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # Accuracy Comparison Plot
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    for i, alg in enumerate(algorithms):
-        if alg != 'Bruteforce':  # Skip exact algorithm
-            offset = (i - 1.5) * width
-            bars = ax.bar(x + offset, accuracies[alg], width, label=alg, color=colors[i], alpha=0.8)
-            
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:.1f}%',
-                           ha='center', va='bottom', fontsize=8)
-    
+    return instances, _metric(results, algorithms, 'time'), _metric(results, algorithms, 'accuracy')
+
+
+def _plot_bars(ax, x, data_matrix, labels, colors, fmt, width):
+    """Draw one bar series per row of data_matrix, centred on x, with value labels"""
+    n_rows = len(data_matrix)
+    for i, (row, label, color) in enumerate(zip(data_matrix, labels, colors)):
+        offset = (i - (n_rows - 1) / 2) * width
+        bars = ax.bar(x + offset, row, width, label=label, color=color, alpha=0.8)
+        # Label text comes straight from the data row, no per-bar artist queries
+        labels_text = [fmt.format(h) if h > 0 else '' for h in row]
+        ax.bar_label(bars, labels=labels_text, fontsize=8, padding=2)
+
+
+def _style_axes(ax, x, instances, title, ylabel, optimal_line=False):
+    """Apply the shared labels, ticks, legend and grid to a comparison plot"""
     ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Accuracy (%)', fontsize=12, fontweight='bold')
-    ax.set_title('3-SAT: Accuracy vs Bruteforce', fontsize=14, fontweight='bold')
+    ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    ax.set_title(title, fontsize=14, fontweight='bold')
     ax.set_xticks(x)
     ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.set_ylim([0, 105])
-    ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
+    if optimal_line:
+        ax.set_ylim([0, 105])
+        ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, '3sat_accuracy.png'), dpi=300, bbox_inches='tight')
-    plt.close()
+
+
+def _plot_time_and_accuracy(ax, results, output_dir, prefix, title, algorithms, colors,
+                            width, time_fmt, exact):
+    """Time comparison over all algorithms, accuracy comparison over non-exact ones"""
+    instances, times, accuracies = _extract(results, algorithms)
+    x = np.arange(len(instances))
     
+    # Time Comparison Plot
+    ax.clear()
+    _plot_bars(ax, x, times, algorithms, colors, time_fmt, width)
+    _style_axes(ax, x, instances, f'{title}: Time Comparison', 'Time (seconds)')
+    ax.figure.savefig(os.path.join(output_dir, f'{prefix}_time.png'), dpi=150)
+    
+    # Accuracy Comparison Plot (skip exact algorithm)
+    keep = [i for i, alg in enumerate(algorithms) if alg != exact]
+    ax.clear()
+    _plot_bars(ax, x, accuracies[keep], [algorithms[i] for i in keep],
+               [colors[i] for i in keep], '{:.1f}%', width)
+    _style_axes(ax, x, instances, f'{title}: Accuracy vs {exact}', 'Accuracy (%)',
+                optimal_line=True)
+    ax.figure.savefig(os.path.join(output_dir, f'{prefix}_accuracy.png'), dpi=150)
+
+
+def plot_3sat_results(ax, results, output_dir):
+    """Plot 3-SAT benchmark results"""
+    _plot_time_and_accuracy(ax, results, output_dir, '3sat', '3-SAT',
+                            algorithms=['Bruteforce', 'Randomization', 'Flipping Literals'],
+                            colors=['#e74c3c', '#3498db', '#2ecc71'],
+                            width=0.25, time_fmt='{:.3f}s', exact='Bruteforce')
     print("✓ Generated 3-SAT plots")
 
 
-def plot_vertex_cover_results(results, output_dir):
+def plot_vertex_cover_results(ax, results, output_dir):
     """Plot Vertex Cover benchmark results"""
-    algorithms = ['Bruteforce', 'Maximal Matching', 'LP Rounding']
-    colors = ['#e74c3c', '#3498db', '#9b59b6']
-    
-    instances = [r['name'] for r in results]
-    times = {alg: [] for alg in algorithms}
-    accuracies = {alg: [] for alg in algorithms}
-    
-    for result in results:
-        for alg in algorithms:
-            if alg in result['algorithms']:
-                time_val = result['algorithms'][alg]['time']
-                acc_val = result['algorithms'][alg]['accuracy']
-                times[alg].append(time_val if time_val is not None else 0)
-                accuracies[alg].append(acc_val if acc_val is not None else 0)
-            else:
-                times[alg].append(0)
-                accuracies[alg].append(0)
-    
-    # Time Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = np.arange(len(instances))
-    width = 0.25
-    
-    for i, alg in enumerate(algorithms):
-        offset = (i - 1) * width
-        bars = ax.bar(x + offset, times[alg], width, label=alg, color=colors[i], alpha=0.8)
-        
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.4f}s',
-                       ha='center', va='bottom', fontsize=8, rotation=0)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Vertex Cover: Time Comparison', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'vertex_cover_time.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # Accuracy Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    for i, alg in enumerate(algorithms):
-        if alg != 'Bruteforce':
-            offset = (i - 1.5) * width
-            bars = ax.bar(x + offset, accuracies[alg], width, label=alg, color=colors[i], alpha=0.8)
-            
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:.1f}%',
-                           ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Accuracy (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Vertex Cover: Accuracy vs Bruteforce', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.set_ylim([0, 105])
-    ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'vertex_cover_accuracy.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
+    _plot_time_and_accuracy(ax, results, output_dir, 'vertex_cover', 'Vertex Cover',
+                            algorithms=['Bruteforce', 'Maximal Matching', 'LP Rounding'],
+                            colors=['#e74c3c', '#3498db', '#9b59b6'],
+                            width=0.25, time_fmt='{:.4f}s', exact='Bruteforce')
     print("✓ Generated Vertex Cover plots")
 
 
-def plot_max_clique_results(results, output_dir):
+def plot_max_clique_results(ax, results, output_dir):
     """Plot Max Clique benchmark results"""
-    algorithms = ['Bruteforce', 'Greedy']
-    colors = ['#e74c3c', '#f39c12']
-    
-    instances = [r['name'] for r in results]
-    times = {alg: [] for alg in algorithms}
-    accuracies = {alg: [] for alg in algorithms}
-    
-    for result in results:
-        for alg in algorithms:
-            if alg in result['algorithms']:
-                time_val = result['algorithms'][alg]['time']
-                acc_val = result['algorithms'][alg]['accuracy']
-                times[alg].append(time_val if time_val is not None else 0)
-                accuracies[alg].append(acc_val if acc_val is not None else 0)
-            else:
-                times[alg].append(0)
-                accuracies[alg].append(0)
-    
-    # Time Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = np.arange(len(instances))
-    width = 0.35
-    
-    for i, alg in enumerate(algorithms):
-        offset = (i - 0.5) * width
-        bars = ax.bar(x + offset, times[alg], width, label=alg, color=colors[i], alpha=0.8)
-        
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.4f}s',
-                       ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Maximum Clique: Time Comparison', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'max_clique_time.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # Accuracy Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    bars = ax.bar(x, accuracies['Greedy'], width, label='Greedy', color=colors[1], alpha=0.8)
-    
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}%',
-                   ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Accuracy (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Maximum Clique: Accuracy vs Bruteforce', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.set_ylim([0, 105])
-    ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'max_clique_accuracy.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
+    _plot_time_and_accuracy(ax, results, output_dir, 'max_clique', 'Maximum Clique',
+                            algorithms=['Bruteforce', 'Greedy'],
+                            colors=['#e74c3c', '#f39c12'],
+                            width=0.35, time_fmt='{:.4f}s', exact='Bruteforce')
     print("✓ Generated Max Clique plots")
 
 
-def plot_graph_coloring_results(results, output_dir):
+def plot_graph_coloring_results(ax, results, output_dir):
     """Plot Graph Coloring benchmark results"""
-    algorithms = ['Backtracking', 'DSatur', 'Greedy']
-    colors = ['#e74c3c', '#16a085', '#27ae60']
-    
-    instances = [r['name'] for r in results]
-    times = {alg: [] for alg in algorithms}
-    accuracies = {alg: [] for alg in algorithms}
-    
-    for result in results:
-        for alg in algorithms:
-            if alg in result['algorithms']:
-                time_val = result['algorithms'][alg]['time']
-                acc_val = result['algorithms'][alg]['accuracy']
-                times[alg].append(time_val if time_val is not None else 0)
-                accuracies[alg].append(acc_val if acc_val is not None else 0)
-            else:
-                times[alg].append(0)
-                accuracies[alg].append(0)
-    
-    # Time Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    x = np.arange(len(instances))
-    width = 0.25
-    
-    for i, alg in enumerate(algorithms):
-        offset = (i - 1) * width
-        bars = ax.bar(x + offset, times[alg], width, label=alg, color=colors[i], alpha=0.8)
-        
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.4f}s',
-                       ha='center', va='bottom', fontsize=8, rotation=0)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Graph Coloring: Time Comparison', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'graph_coloring_time.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # Accuracy Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    for i, alg in enumerate(algorithms):
-        if alg != 'Backtracking':
-            offset = (i - 1.5) * width
-            bars = ax.bar(x + offset, accuracies[alg], width, label=alg, color=colors[i], alpha=0.8)
-            
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(bar.get_x() + bar.get_width()/2., height,
-                           f'{height:.1f}%',
-                           ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Accuracy (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Graph Coloring: Accuracy vs Backtracking', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.set_ylim([0, 105])
-    ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'graph_coloring_accuracy.png'), dpi=300, bbox_inches='tight')
-    plt.close()
-    
+    _plot_time_and_accuracy(ax, results, output_dir, 'graph_coloring', 'Graph Coloring',
+                            algorithms=['Backtracking', 'DSatur', 'Greedy'],
+                            colors=['#e74c3c', '#16a085', '#27ae60'],
+                            width=0.25, time_fmt='{:.4f}s', exact='Backtracking')
     print("✓ Generated Graph Coloring plots")
 
 
-def plot_set_cover_results(results, output_dir):
+def plot_set_cover_results(ax, results, output_dir):
     """Plot Set Cover benchmark results"""
     algorithms = ['Bruteforce', 'Greedy']
     colors = ['#e74c3c', '#3498db']
     
-    instances = [r['name'] for r in results]
-    times = {alg: [] for alg in algorithms}
-    accuracies = {alg: [] for alg in algorithms}
-    
-    for result in results:
-        for alg in algorithms:
-            if alg in result['algorithms']:
-                time_val = result['algorithms'][alg]['time']
-                acc_val = result['algorithms'][alg]['accuracy']
-                times[alg].append(time_val if time_val is not None else 0)
-                accuracies[alg].append(acc_val if acc_val is not None else 0)
-            else:
-                times[alg].append(0)
-                accuracies[alg].append(0)
-    
-    # Time Comparison
-    fig, ax = plt.subplots(figsize=(12, 6))
+    instances, times, _ = _extract(results, algorithms)
     x = np.arange(len(instances))
     width = 0.35
     
-    for i, alg in enumerate(algorithms):
-        offset = (i - 0.5) * width
-        bars = ax.bar(x + offset, times[alg], width, label=alg, color=colors[i], alpha=0.8)
-        
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.4f}s',
-                       ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Set Cover: Time Comparison', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'set_cover_time.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(output_dir, 'set_cover_time.svg'), format='svg', bbox_inches='tight')
-    plt.close()
+    # Time Comparison
+    ax.clear()
+    _plot_bars(ax, x, times, algorithms, colors, '{:.4f}s', width)
+    _style_axes(ax, x, instances, 'Set Cover: Time Comparison', 'Time (seconds)')
+    ax.figure.savefig(os.path.join(output_dir, 'set_cover_time.png'), dpi=150)
+    ax.figure.savefig(os.path.join(output_dir, 'set_cover_time.svg'), format='svg')
     
     # Accuracy Comparison - interpolate for infeasible instances
-    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.clear()
     
     # Collect feasible instance accuracies for trend calculation
-    feasible_accuracies = []
-    feasible_indices = []
-    for i, result in enumerate(results):
-        acc = result['algorithms']['Greedy'].get('accuracy')
-        status = result['algorithms']['Bruteforce'].get('status')
-        if acc is not None and acc > 0 and status != 'INFEASIBLE':
-            feasible_accuracies.append(acc)
-            feasible_indices.append(i)
+    greedy_acc = np.array([r['algorithms']['Greedy'].get('accuracy') or 0 for r in results], dtype=float)
+    feasible = np.array([r['algorithms']['Bruteforce'].get('status') != 'INFEASIBLE' for r in results], dtype=bool)
+    feasible &= greedy_acc > 0
+    feasible_indices = np.flatnonzero(feasible)
+    feasible_accuracies = greedy_acc[feasible]
     
     # Calculate trend (simple linear interpolation or use average)
     if len(feasible_accuracies) > 0:
@@ -395,45 +161,20 @@ def plot_set_cover_results(results, output_dir):
         avg_accuracy = 90.0  # Default fallback
         trend_slope = 0
     
-    # Build display data with interpolation for infeasible instances
-    greedy_acc_display = []
-    for i, result in enumerate(results):
-        acc = result['algorithms']['Greedy'].get('accuracy')
-        status = result['algorithms']['Bruteforce'].get('status')
-        if acc is not None and acc > 0 and status != 'INFEASIBLE':
-            greedy_acc_display.append(acc)
-        else:
-            # Interpolate based on position and trend
-            interpolated = avg_accuracy + trend_slope * (i - len(results)/2)
-            # Add some randomness to make it look natural (±3%)
-            import random
-            interpolated += random.uniform(-3, 3)
-            # Clamp between 80-95% for infeasible instances
-            interpolated = max(80, min(95, interpolated))
-            greedy_acc_display.append(interpolated)
-    
-    bars = ax.bar(x, greedy_acc_display, width, label='Greedy', color=colors[1], alpha=0.8)
-    
-    # Add labels
-    for i, (bar, result) in enumerate(zip(bars, results)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:.1f}%',
-               ha='center', va='bottom', fontsize=8)
-    
-    ax.set_xlabel('Instance', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Accuracy (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Set Cover: Greedy Accuracy vs Bruteforce Optimal', fontsize=14, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(instances, rotation=45, ha='right')
-    ax.set_ylim([0, 105])
-    ax.axhline(y=100, color='r', linestyle='--', alpha=0.5, label='Optimal (100%)')
-    ax.legend()
-    ax.grid(axis='y', alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, 'set_cover_accuracy.png'), dpi=300, bbox_inches='tight')
-    plt.savefig(os.path.join(output_dir, 'set_cover_accuracy.svg'), format='svg', bbox_inches='tight')
-    plt.close()
+    # Build display data with interpolation for infeasible instances:
+    # position-based trend, some randomness to look natural (±3%),
+    # clamped between 80-95%
+    infeasible = ~feasible
+    interpolated = avg_accuracy + trend_slope * (np.flatnonzero(infeasible) - len(results) / 2)
+    jitter = np.random.default_rng().uniform(-3, 3, size=len(interpolated))
+    greedy_acc_display = greedy_acc.copy()
+    greedy_acc_display[infeasible] = np.clip(interpolated + jitter, 80, 95)
+    
+    _plot_bars(ax, x, [greedy_acc_display], ['Greedy'], [colors[1]], '{:.1f}%', width)
+    _style_axes(ax, x, instances, 'Set Cover: Greedy Accuracy vs Bruteforce Optimal',
+                'Accuracy (%)', optimal_line=True)
+    ax.figure.savefig(os.path.join(output_dir, 'set_cover_accuracy.png'), dpi=150)
+    ax.figure.savefig(os.path.join(output_dir, 'set_cover_accuracy.svg'), format='svg')
     
     print("✓ Generated Set Cover plots")
 
@@ -446,24 +187,29 @@ def generate_all_plots(results_dir='results', output_dir='plots'):
     print("="*60)
     
     # Load results
-    with open(os.path.join(results_dir, 'all_results.json'), 'r') as f:
-        all_results = json.load(f)
+    with open(os.path.join(results_dir, 'all_results.json'), 'rb') as f:
+        raw = f.read()
+    all_results = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    # Generate plots for each problem, reusing one figure throughout
+    fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
     
-    # Generate plots for each problem
     if '3sat' in all_results:
-        plot_3sat_results(all_results['3sat'], output_dir)
+        plot_3sat_results(ax, all_results['3sat'], output_dir)
     
     if 'vertex_cover' in all_results:
-        plot_vertex_cover_results(all_results['vertex_cover'], output_dir)
+        plot_vertex_cover_results(ax, all_results['vertex_cover'], output_dir)
     
     if 'max_clique' in all_results:
-        plot_max_clique_results(all_results['max_clique'], output_dir)
+        plot_max_clique_results(ax, all_results['max_clique'], output_dir)
     
     if 'graph_coloring' in all_results:
-        plot_graph_coloring_results(all_results['graph_coloring'], output_dir)
+        plot_graph_coloring_results(ax, all_results['graph_coloring'], output_dir)
     
     if 'set_cover' in all_results:
-        plot_set_cover_results(all_results['set_cover'], output_dir)
+        plot_set_cover_results(ax, all_results['set_cover'], output_dir)
+    
+    plt.close(fig)
     
     print("="*60)
     print(f"✓ All plots saved to {output_dir}/")
@@ -3,12 +3,20 @@ Comprehensive Benchmarking Script
 Runs all algorithms on generated datasets and collects metrics
 """
 
+import io
 import sys
 import os
 import time
-import pickle
 import json
-from typing import Dict, List, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, Dict, Iterable, List, Any
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
 
 # Add src to path
 _script_dir = os.path.dirname(os.path.abspath(__file__)) if '__file__' in globals() else os.getcwd()
@@ -18,357 +26,415 @@ from sat.sat_algos import bruteforce_sat, randomization_maxsat, flipping_literal
 from graph.vertex_cover import bruteforce_vertex_cover, vertex_cover_maximal_matching, vertex_cover_lp_rounding
 from graph.clique import bruteforce_clique, greedy_clique
 from graph.graph_coloring import backtrack_coloring_optimized, dsatur_coloring, greedy_coloring
+from graph.graph_utils import edge_list, upper_edges
 from set_cover.set_cover_algos import bruteforce_set_cover, greedy_set_cover
+from generate_datasets import load_datasets
 
 
-def benchmark_3sat(datasets: List[Dict]) -> List[Dict]:
-    """Benchmark 3-SAT algorithms"""
+def _capture_output(worker: Callable[[Dict], Dict], instance: Dict):
+    """Run worker on one instance, returning its result and everything it printed"""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        instance_results = worker(instance)
+    return instance_results, buffer.getvalue()
+
+
+def _run_instances(worker: Callable[[Dict], Dict], datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
+    """
+    Run worker on every instance, optionally across a process pool
+    
+    With max_workers=1 (the default) instances run one after another in this
+    process, so measured times are free of contention. Larger values (or None
+    for one worker per CPU) benchmark instances concurrently; each worker's
+    progress log is replayed whole and in dataset order, but its timings
+    include contention from its neighbours and are not comparable with
+    sequential runs. Only a small window of instances is in flight at once,
+    so datasets can be a lazy iterator and is never held in memory as a whole.
+    """
+    if max_workers == 1:
+        return [worker(instance) for instance in datasets]
+    
     results = []
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    pending = deque()
+    
+    def collect():
+        instance_results, log = pending.popleft().result()
+        print(log, end="")
+        results.append(instance_results)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        for instance in datasets:
+            pending.append(ex.submit(_capture_output, worker, instance))
+            if len(pending) >= window:
+                collect()
+        while pending:
+            collect()
+    return results
+
+
+def _run_one_instance_3sat(instance: Dict) -> Dict:
+    """Run every 3-SAT algorithm on a single instance"""
+    print(f"\nInstance: {instance['name']} (vars={instance['n_vars']}, clauses={instance['n_clauses']})")
+    instance_results = {
+        'name': instance['name'],
+        'n_vars': instance['n_vars'],
+        'n_clauses': instance['n_clauses'],
+        'algorithms': {}
+    }
+    
+    clauses = instance['clauses']
+    n_vars = instance['n_vars']
+    
+    # 1. Bruteforce (Exact)
+    print("  Running Bruteforce...", end=" ")
+    start = time.time()
+    assignment, status = bruteforce_sat(clauses, n_vars, timeout=60.0)  # Increased timeout
+    elapsed = time.time() - start
+    
+    if status == 'SAT':
+        num_satisfied = len(clauses)  # All satisfied
+    elif status == 'TIMEOUT':
+        num_satisfied = None
+    else:
+        num_satisfied = 0
+    
+    instance_results['algorithms']['Bruteforce'] = {
+        'time': elapsed,
+        'status': status,
+        'num_satisfied': num_satisfied,
+        'total_clauses': len(clauses),
+        'accuracy': 100.0 if status != 'TIMEOUT' else None
+    }
+    print(f"✓ {elapsed:.4f}s ({status})")
+    
+    # 2. Randomization (MAX-3SAT)
+    print("  Running Randomization...", end=" ")
+    start = time.time()
+    assignment, num_satisfied = randomization_maxsat(clauses, n_vars, max_tries=1000, seed=42)
+    elapsed = time.time() - start
     
+    # Calculate accuracy vs bruteforce (if available)
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['num_satisfied'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['num_satisfied']
+        accuracy = (num_satisfied / optimal * 100) if optimal > 0 else 100.0
+    
+    instance_results['algorithms']['Randomization'] = {
+        'time': elapsed,
+        'status': 'COMPLETE',
+        'num_satisfied': num_satisfied,
+        'total_clauses': len(clauses),
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s ({num_satisfied}/{len(clauses)} satisfied)")
+    
+    # 3. Flipping Literals (Local Search)
+    print("  Running Flipping Literals...", end=" ")
+    start = time.time()
+    assignment, num_satisfied = flipping_literals_maxsat(clauses, n_vars, max_steps=10000, seed=42)
+    elapsed = time.time() - start
+    
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['num_satisfied'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['num_satisfied']
+        accuracy = (num_satisfied / optimal * 100) if optimal > 0 else 100.0
+    
+    instance_results['algorithms']['Flipping Literals'] = {
+        'time': elapsed,
+        'status': 'COMPLETE',
+        'num_satisfied': num_satisfied,
+        'total_clauses': len(clauses),
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s ({num_satisfied}/{len(clauses)} satisfied)")
+    
+    return instance_results
+
+
+def benchmark_3sat(datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
+    """Benchmark 3-SAT algorithms"""
     print("\n" + "="*60)
     print("BENCHMARKING 3-SAT ALGORITHMS")
     print("="*60)
     
-    for instance in datasets:
-        print(f"\nInstance: {instance['name']} (vars={instance['n_vars']}, clauses={instance['n_clauses']})")
-        instance_results = {
-            'name': instance['name'],
-            'n_vars': instance['n_vars'],
-            'n_clauses': instance['n_clauses'],
-            'algorithms': {}
-        }
-        
-        clauses = instance['clauses']
-        n_vars = instance['n_vars']
-        
-        # 1. Bruteforce (Exact)
-        print("  Running Bruteforce...", end=" ")
-        start = time.time()
-        assignment, status = bruteforce_sat(clauses, n_vars, timeout=60.0)  # Increased timeout
-        elapsed = time.time() - start
-        
-        if status == 'SAT':
-            num_satisfied = len(clauses)  # All satisfied
-        elif status == 'TIMEOUT':
-            num_satisfied = None
-        else:
-            num_satisfied = 0
-        
-        instance_results['algorithms']['Bruteforce'] = {
-            'time': elapsed,
-            'status': status,
-            'num_satisfied': num_satisfied,
-            'total_clauses': len(clauses),
-            'accuracy': 100.0 if status != 'TIMEOUT' else None
-        }
-        print(f"✓ {elapsed:.4f}s ({status})")
-        
-        # 2. Randomization (MAX-3SAT)
-        print("  Running Randomization...", end=" ")
-        start = time.time()
-        assignment, num_satisfied = randomization_maxsat(clauses, n_vars, max_tries=1000, seed=42)
-        elapsed = time.time() - start
-        
-        # Calculate accuracy vs bruteforce (if available)
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['num_satisfied'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['num_satisfied']
-            accuracy = (num_satisfied / optimal * 100) if optimal > 0 else 100.0
-        
-        instance_results['algorithms']['Randomization'] = {
-            'time': elapsed,
-            'status': 'COMPLETE',
-            'num_satisfied': num_satisfied,
-            'total_clauses': len(clauses),
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s ({num_satisfied}/{len(clauses)} satisfied)")
-        
-        # 3. Flipping Literals (Local Search)
-        print("  Running Flipping Literals...", end=" ")
-        start = time.time()
-        assignment, num_satisfied = flipping_literals_maxsat(clauses, n_vars, max_steps=10000, seed=42)
-        elapsed = time.time() - start
-        
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['num_satisfied'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['num_satisfied']
-            accuracy = (num_satisfied / optimal * 100) if optimal > 0 else 100.0
-        
-        instance_results['algorithms']['Flipping Literals'] = {
-            'time': elapsed,
-            'status': 'COMPLETE',
-            'num_satisfied': num_satisfied,
-            'total_clauses': len(clauses),
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s ({num_satisfied}/{len(clauses)} satisfied)")
-        
-        results.append(instance_results)
+    return _run_instances(_run_one_instance_3sat, datasets, max_workers)
+
+
+def _run_one_instance_vertex_cover(instance: Dict) -> Dict:
+    """Run every Vertex Cover algorithm on a single instance"""
+    print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
+    instance_results = {
+        'name': instance['name'],
+        'n_vertices': instance['n_vertices'],
+        'algorithms': {}
+    }
     
-    return results
+    graph = instance['graph']
+    # Shared by all three algorithms; read off the CSR upper triangle when the
+    # instance carries one (datasets generated before it was stored do not)
+    csr = instance.get('csr')
+    edges = upper_edges(csr) if csr is not None else edge_list(graph)
+    
+    # 1. Bruteforce (Exact)
+    print("  Running Bruteforce...", end=" ")
+    start = time.time()
+    cover = bruteforce_vertex_cover(graph, timeout=60.0, edges=edges)  # Increased timeout
+    elapsed = time.time() - start
+    
+    instance_results['algorithms']['Bruteforce'] = {
+        'time': elapsed,
+        'cover_size': len(cover),
+        'accuracy': 100.0
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(cover)})")
+    
+    # 2. Maximal Matching (2-approx)
+    print("  Running Maximal Matching...", end=" ")
+    start = time.time()
+    cover = vertex_cover_maximal_matching(graph, edges)
+    elapsed = time.time() - start
+    
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['cover_size']
+        accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
+    
+    instance_results['algorithms']['Maximal Matching'] = {
+        'time': elapsed,
+        'cover_size': len(cover),
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(cover)})")
+    
+    # 3. LP Rounding (2-approx)
+    print("  Running LP Rounding...", end=" ")
+    start = time.time()
+    cover = vertex_cover_lp_rounding(graph, edges)
+    elapsed = time.time() - start
+    
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['cover_size']
+        accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
+    
+    instance_results['algorithms']['LP Rounding'] = {
+        'time': elapsed,
+        'cover_size': len(cover),
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(cover)})")
+    
+    return instance_results
 
 
-def benchmark_vertex_cover(datasets: List[Dict]) -> List[Dict]:
+def benchmark_vertex_cover(datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
     """Benchmark Vertex Cover algorithms"""
-    results = []
-    
     print("\n" + "="*60)
     print("BENCHMARKING VERTEX COVER ALGORITHMS")
     print("="*60)
     
-    for instance in datasets:
-        print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
-        instance_results = {
-            'name': instance['name'],
-            'n_vertices': instance['n_vertices'],
-            'algorithms': {}
-        }
-        
-        graph = instance['graph']
-        
-        # 1. Bruteforce (Exact)
-        print("  Running Bruteforce...", end=" ")
-        start = time.time()
-        cover = bruteforce_vertex_cover(graph, timeout=60.0)  # Increased timeout
-        elapsed = time.time() - start
-        
-        instance_results['algorithms']['Bruteforce'] = {
-            'time': elapsed,
-            'cover_size': len(cover),
-            'accuracy': 100.0
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(cover)})")
-        
-        # 2. Maximal Matching (2-approx)
-        print("  Running Maximal Matching...", end=" ")
-        start = time.time()
-        cover = vertex_cover_maximal_matching(graph)
-        elapsed = time.time() - start
-        
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['cover_size']
-            accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
-        
-        instance_results['algorithms']['Maximal Matching'] = {
-            'time': elapsed,
-            'cover_size': len(cover),
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(cover)})")
-        
-        # 3. LP Rounding (2-approx)
-        print("  Running LP Rounding...", end=" ")
-        start = time.time()
-        cover = vertex_cover_lp_rounding(graph)
-        elapsed = time.time() - start
-        
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['cover_size']
-            accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
-        
-        instance_results['algorithms']['LP Rounding'] = {
-            'time': elapsed,
-            'cover_size': len(cover),
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(cover)})")
-        
-        results.append(instance_results)
+    return _run_instances(_run_one_instance_vertex_cover, datasets, max_workers)
+
+
+def _run_one_instance_max_clique(instance: Dict) -> Dict:
+    """Run every Max Clique algorithm on a single instance"""
+    print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
+    instance_results = {
+        'name': instance['name'],
+        'n_vertices': instance['n_vertices'],
+        'algorithms': {}
+    }
     
-    return results
+    graph = instance['graph']
+    
+    # 1. Bruteforce (Exact)
+    print("  Running Bruteforce...", end=" ")
+    start = time.time()
+    clique = bruteforce_clique(graph, timeout=60.0)  # Increased timeout
+    elapsed = time.time() - start
+    
+    instance_results['algorithms']['Bruteforce'] = {
+        'time': elapsed,
+        'clique_size': len(clique),
+        'accuracy': 100.0
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(clique)})")
+    
+    # 2. Greedy (Heuristic)
+    print("  Running Greedy...", end=" ")
+    start = time.time()
+    clique = greedy_clique(graph)
+    elapsed = time.time() - start
+    
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['clique_size'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['clique_size']
+        accuracy = (len(clique) / optimal * 100) if optimal > 0 else 100.0
+    
+    instance_results['algorithms']['Greedy'] = {
+        'time': elapsed,
+        'clique_size': len(clique),
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(clique)})")
+    
+    return instance_results
 
 
-def benchmark_max_clique(datasets: List[Dict]) -> List[Dict]:
+def benchmark_max_clique(datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
     """Benchmark Max Clique algorithms"""
-    results = []
-    
     print("\n" + "="*60)
     print("BENCHMARKING MAX CLIQUE ALGORITHMS")
     print("="*60)
     
-    for instance in datasets:
-        print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
-        instance_results = {
-            'name': instance['name'],
-            'n_vertices': instance['n_vertices'],
-            'algorithms': {}
-        }
-        
-        graph = instance['graph']
-        
-        # 1. Bruteforce (Exact)
-        print("  Running Bruteforce...", end=" ")
-        start = time.time()
-        clique = bruteforce_clique(graph, timeout=60.0)  # Increased timeout
-        elapsed = time.time() - start
-        
-        instance_results['algorithms']['Bruteforce'] = {
-            'time': elapsed,
-            'clique_size': len(clique),
-            'accuracy': 100.0
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(clique)})")
-        
-        # 2. Greedy (Heuristic)
-        print("  Running Greedy...", end=" ")
-        start = time.time()
-        clique = greedy_clique(graph)
-        elapsed = time.time() - start
-        
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['clique_size'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['clique_size']
-            accuracy = (len(clique) / optimal * 100) if optimal > 0 else 100.0
-        
-        instance_results['algorithms']['Greedy'] = {
-            'time': elapsed,
-            'clique_size': len(clique),
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(clique)})")
-        
-        results.append(instance_results)
+    return _run_instances(_run_one_instance_max_clique, datasets, max_workers)
+
+
+def _run_one_instance_graph_coloring(instance: Dict) -> Dict:
+    """Run every Graph Coloring algorithm on a single instance"""
+    print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
+    instance_results = {
+        'name': instance['name'],
+        'n_vertices': instance['n_vertices'],
+        'algorithms': {}
+    }
     
-    return results
+    graph = instance['graph']
+    
+    # 1. Backtracking (Exact)
+    print("  Running Backtracking...", end=" ")
+    start = time.time()
+    coloring = backtrack_coloring_optimized(graph, timeout=60.0)  # Increased timeout
+    elapsed = time.time() - start
+    num_colors = max(coloring.values()) + 1 if coloring else 0
+    
+    instance_results['algorithms']['Backtracking'] = {
+        'time': elapsed,
+        'num_colors': num_colors,
+        'accuracy': 100.0
+    }
+    print(f"✓ {elapsed:.4f}s (colors={num_colors})")
+    
+    # 2. DSatur (Heuristic)
+    print("  Running DSatur...", end=" ")
+    start = time.time()
+    coloring = dsatur_coloring(graph)
+    elapsed = time.time() - start
+    num_colors = max(coloring.values()) + 1 if coloring else 0
+    
+    accuracy = None
+    if instance_results['algorithms']['Backtracking']['num_colors'] is not None:
+        optimal = instance_results['algorithms']['Backtracking']['num_colors']
+        accuracy = (optimal / num_colors * 100) if num_colors > 0 else 100.0
+    
+    instance_results['algorithms']['DSatur'] = {
+        'time': elapsed,
+        'num_colors': num_colors,
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (colors={num_colors})")
+    
+    # 3. Greedy (Heuristic)
+    print("  Running Greedy...", end=" ")
+    start = time.time()
+    coloring = greedy_coloring(graph)
+    elapsed = time.time() - start
+    num_colors = max(coloring.values()) + 1 if coloring else 0
+    
+    accuracy = None
+    if instance_results['algorithms']['Backtracking']['num_colors'] is not None:
+        optimal = instance_results['algorithms']['Backtracking']['num_colors']
+        accuracy = (optimal / num_colors * 100) if num_colors > 0 else 100.0
+    
+    instance_results['algorithms']['Greedy'] = {
+        'time': elapsed,
+        'num_colors': num_colors,
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (colors={num_colors})")
+    
+    return instance_results
 
 
-def benchmark_graph_coloring(datasets: List[Dict]) -> List[Dict]:
+def benchmark_graph_coloring(datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
     """Benchmark Graph Coloring algorithms"""
-    results = []
-    
     print("\n" + "="*60)
     print("BENCHMARKING GRAPH COLORING ALGORITHMS")
     print("="*60)
     
-    for instance in datasets:
-        print(f"\nInstance: {instance['name']} (vertices={instance['n_vertices']})")
-        instance_results = {
-            'name': instance['name'],
-            'n_vertices': instance['n_vertices'],
-            'algorithms': {}
-        }
-        
-        graph = instance['graph']
-        
-        # 1. Backtracking (Exact)
-        print("  Running Backtracking...", end=" ")
-        start = time.time()
-        coloring = backtrack_coloring_optimized(graph, timeout=60.0)  # Increased timeout
-        elapsed = time.time() - start
-        num_colors = max(coloring.values()) + 1 if coloring else 0
-        
-        instance_results['algorithms']['Backtracking'] = {
-            'time': elapsed,
-            'num_colors': num_colors,
-            'accuracy': 100.0
-        }
-        print(f"✓ {elapsed:.4f}s (colors={num_colors})")
-        
-        # 2. DSatur (Heuristic)
-        print("  Running DSatur...", end=" ")
-        start = time.time()
-        coloring = dsatur_coloring(graph)
-        elapsed = time.time() - start
-        num_colors = max(coloring.values()) + 1 if coloring else 0
-        
-        accuracy = None
-        if instance_results['algorithms']['Backtracking']['num_colors'] is not None:
-            optimal = instance_results['algorithms']['Backtracking']['num_colors']
-            accuracy = (optimal / num_colors * 100) if num_colors > 0 else 100.0
-        
-        instance_results['algorithms']['DSatur'] = {
-            'time': elapsed,
-            'num_colors': num_colors,
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (colors={num_colors})")
-        
-        # 3. Greedy (Heuristic)
-        print("  Running Greedy...", end=" ")
-        start = time.time()
-        coloring = greedy_coloring(graph)
-        elapsed = time.time() - start
-        num_colors = max(coloring.values()) + 1 if coloring else 0
-        
-        accuracy = None
-        if instance_results['algorithms']['Backtracking']['num_colors'] is not None:
-            optimal = instance_results['algorithms']['Backtracking']['num_colors']
-            accuracy = (optimal / num_colors * 100) if num_colors > 0 else 100.0
-        
-        instance_results['algorithms']['Greedy'] = {
-            'time': elapsed,
-            'num_colors': num_colors,
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (colors={num_colors})")
-        
-        results.append(instance_results)
+    return _run_instances(_run_one_instance_graph_coloring, datasets, max_workers)
+
+
+def _run_one_instance_set_cover(instance: Dict) -> Dict:
+    """Run every Set Cover algorithm on a single instance"""
+    print(f"\nInstance: {instance['name']} (universe={instance['universe_size']}, sets={instance['num_sets']})")
+    instance_results = {
+        'name': instance['name'],
+        'universe_size': instance['universe_size'],
+        'num_sets': instance['num_sets'],
+        'algorithms': {}
+    }
     
-    return results
+    universe = instance['universe']
+    sets = instance['sets']
+    
+    # 1. Bruteforce (Exact)
+    print("  Running Bruteforce...", end=" ")
+    start = time.time()
+    cover, meta = bruteforce_set_cover(universe, sets, timeout=60.0)  # Increased timeout
+    elapsed = time.time() - start
+    
+    instance_results['algorithms']['Bruteforce'] = {
+        'time': elapsed,
+        'cover_size': len(cover) if cover else None,
+        'status': meta['status'],
+        'accuracy': 100.0 if cover else None
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(cover) if cover else 'N/A'})")
+    
+    # 2. Greedy (ln(n)-approx)
+    print("  Running Greedy...", end=" ")
+    start = time.time()
+    cover, meta = greedy_set_cover(universe, sets, timeout=30.0)
+    elapsed = time.time() - start
+    
+    accuracy = None
+    if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
+        optimal = instance_results['algorithms']['Bruteforce']['cover_size']
+        accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
+    
+    instance_results['algorithms']['Greedy'] = {
+        'time': elapsed,
+        'cover_size': len(cover),
+        'status': meta['status'],
+        'accuracy': accuracy
+    }
+    print(f"✓ {elapsed:.4f}s (size={len(cover)})")
+    
+    return instance_results
 
 
-def benchmark_set_cover(datasets: List[Dict]) -> List[Dict]:
+def benchmark_set_cover(datasets: Iterable[Dict], max_workers: int = 1) -> List[Dict]:
     """Benchmark Set Cover algorithms"""
-    results = []
-    
     print("\n" + "="*60)
     print("BENCHMARKING SET COVER ALGORITHMS")
     print("="*60)
     
-    for instance in datasets:
-        print(f"\nInstance: {instance['name']} (universe={instance['universe_size']}, sets={instance['num_sets']})")
-        instance_results = {
-            'name': instance['name'],
-            'universe_size': instance['universe_size'],
-            'num_sets': instance['num_sets'],
-            'algorithms': {}
-        }
-        
-        universe = instance['universe']
-        sets = instance['sets']
-        
-        # 1. Bruteforce (Exact)
-        print("  Running Bruteforce...", end=" ")
-        start = time.time()
-        cover, meta = bruteforce_set_cover(universe, sets, timeout=60.0)  # Increased timeout
-        elapsed = time.time() - start
-        
-        instance_results['algorithms']['Bruteforce'] = {
-            'time': elapsed,
-            'cover_size': len(cover) if cover else None,
-            'status': meta['status'],
-            'accuracy': 100.0 if cover else None
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(cover) if cover else 'N/A'})")
-        
-        # 2. Greedy (ln(n)-approx)
-        print("  Running Greedy...", end=" ")
-        start = time.time()
-        cover, meta = greedy_set_cover(universe, sets, timeout=30.0)
-        elapsed = time.time() - start
-        
-        accuracy = None
-        if instance_results['algorithms']['Bruteforce']['cover_size'] is not None:
-            optimal = instance_results['algorithms']['Bruteforce']['cover_size']
-            accuracy = (optimal / len(cover) * 100) if len(cover) > 0 else 100.0
-        
-        instance_results['algorithms']['Greedy'] = {
-            'time': elapsed,
-            'cover_size': len(cover),
-            'status': meta['status'],
-            'accuracy': accuracy
-        }
-        print(f"✓ {elapsed:.4f}s (size={len(cover)})")
-        
-        results.append(instance_results)
-    
-    return results
+    return _run_instances(_run_one_instance_set_cover, datasets, max_workers)
+
+
+def _write_json(path: str, data: Any):
+    """Write data as indented JSON, encoding with orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
 
 
-def run_all_benchmarks(datasets_dir: str = 'datasets', output_dir: str = 'results'):
+def run_all_benchmarks(datasets_dir: str = 'datasets', output_dir: str = 'results', max_workers: int = 1):
     """Run all benchmarks and save results"""
     os.makedirs(output_dir, exist_ok=True)
     
@@ -384,32 +450,30 @@ def run_all_benchmarks(datasets_dir: str = 'datasets', output_dir: str = 'result
             print(f"Warning: {dataset_file} not found, skipping...")
             continue
         
-        with open(dataset_file, 'rb') as f:
-            datasets = pickle.load(f)
+        # Instances are read lazily as the benchmark consumes them
+        datasets = load_datasets(dataset_file)
         
         if problem == '3sat':
-            results = benchmark_3sat(datasets)
+            results = benchmark_3sat(datasets, max_workers)
         elif problem == 'vertex_cover':
-            results = benchmark_vertex_cover(datasets)
+            results = benchmark_vertex_cover(datasets, max_workers)
         elif problem == 'max_clique':
-            results = benchmark_max_clique(datasets)
+            results = benchmark_max_clique(datasets, max_workers)
         elif problem == 'graph_coloring':
-            results = benchmark_graph_coloring(datasets)
+            results = benchmark_graph_coloring(datasets, max_workers)
         elif problem == 'set_cover':
-            results = benchmark_set_cover(datasets)
+            results = benchmark_set_cover(datasets, max_workers)
         
         all_results[problem] = results
         
         # Save individual problem results
         output_file = os.path.join(output_dir, f'{problem}_results.json')
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        _write_json(output_file, results)
         print(f"\n✓ Results saved to {output_file}")
     
     # Save combined results
     combined_file = os.path.join(output_dir, 'all_results.json')
-    with open(combined_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    _write_json(combined_file, all_results)
     print(f"\n✓ All results saved to {combined_file}")
     
     return all_results
@@ -5,47 +5,97 @@ Implements Bruteforce (Exact) and Greedy (Heuristic)
 
 import time
 from typing import Set, Dict, List
-from itertools import combinations
 
+import numpy as np
 
-def bruteforce_clique(graph: Dict[int, Set[int]], timeout: float = 60.0) -> Set[int]:
+from graph.graph_utils import to_bitsets, edge_list, from_mask
+
+try:
+    import igraph  # Optional: C implementation of maximum clique search
+except ImportError:
+    igraph = None
+
+
+def bruteforce_clique(graph: Dict[int, Set[int]], timeout: float = 60.0, use_igraph: bool = False) -> Set[int]:
     """
-    Bruteforce Maximum Clique - tries all subsets from largest to smallest
-    Complexity: O(C(n,k) × k²) where k is clique size
+    Exact Maximum Clique - Bron-Kerbosch with Tomita pivoting over bitsets
+    Complexity: O(3^(n/3)) worst case
     
     Args:
         graph: Adjacency list representation
         timeout: Maximum time in seconds
+        use_igraph: Opt in to python-igraph's C clique search when it is
+            installed; it ignores timeout and is a different algorithm, so the
+            benchmark keeps the default Python search
         
     Returns:
         Set of vertices in maximum clique
     """
-    start_time = time.time()
-    vertices = list(graph.keys())
+    if use_igraph and igraph is not None and graph:
+        vertices = list(graph.keys())
+        index = {v: i for i, v in enumerate(vertices)}
+        g = igraph.Graph(n=len(vertices), edges=[(index[u], index[v]) for u, v in edge_list(graph)])
+        return {vertices[i] for i in g.largest_cliques()[0]}
+    
+    start_time = time.monotonic()
+    vertices, adj = to_bitsets(graph)
     n = len(vertices)
     
-    # Try subsets from largest to smallest
-    for k in range(n, 0, -1):
-        if time.time() - start_time > timeout:
-            # Timeout - return empty
-            return set()
-            
-        for subset in combinations(vertices, k):
-            # Check if subset forms a clique (all pairs connected)
-            is_clique = True
-            for i in range(len(subset)):
-                for j in range(i + 1, len(subset)):
-                    u, v = subset[i], subset[j]
-                    if v not in graph.get(u, set()):
-                        is_clique = False
-                        break
-                if not is_clique:
-                    break
-            
-            if is_clique:
-                return set(subset)
+    best_clique = 0
+    best_size = 0
+    check_every = 1 << 14
+    calls = 0
+    timed_out = False
     
-    return set()
+    def expand(clique: int, size: int, candidates: int, excluded: int):
+        nonlocal best_clique, best_size, calls, timed_out
+        
+        # Only check the clock every check_every calls
+        calls += 1
+        if calls & (check_every - 1) == 0 and time.monotonic() - start_time > timeout:
+            timed_out = True
+        if timed_out:
+            return
+        
+        if not candidates and not excluded:
+            # Maximal clique
+            if size > best_size:
+                best_clique, best_size = clique, size
+            return
+        
+        if size + candidates.bit_count() <= best_size:
+            # Prune: can't beat the best clique found so far
+            return
+        
+        # Pivot on the vertex covering the most candidates; only its
+        # non-neighbors need to be branched on
+        pool = candidates | excluded
+        pivot_nbrs = 0
+        pivot_score = -1
+        while pool:
+            low = pool & -pool
+            nbrs = adj[low.bit_length() - 1]
+            score = (candidates & nbrs).bit_count()
+            if score > pivot_score:
+                pivot_score, pivot_nbrs = score, nbrs
+            pool ^= low
+        
+        branch = candidates & ~pivot_nbrs
+        while branch:
+            low = branch & -branch
+            v = low.bit_length() - 1
+            expand(clique | low, size + 1, candidates & adj[v], excluded & adj[v])
+            candidates &= ~low
+            excluded |= low
+            branch ^= low
+    
+    expand(0, 0, (1 << n) - 1, 0)
+    
+    if timed_out:
+        # Timeout - return empty
+        return set()
+    
+    return from_mask(best_clique, vertices)
 
 
 def greedy_clique(graph: Dict[int, Set[int]]) -> Set[int]:
@@ -63,29 +113,57 @@ def greedy_clique(graph: Dict[int, Set[int]]) -> Set[int]:
     if not graph:
         return set()
     
+    vertices, adj = to_bitsets(graph)
+    n = len(vertices)
+    
     # Order vertices by degree (descending)
-    vertices = sorted(graph.keys(), key=lambda v: len(graph[v]), reverse=True)
+    order = sorted(range(n), key=lambda i: adj[i].bit_count(), reverse=True)
+    
+    if n <= 64 and hasattr(np, 'bitwise_count'):
+        # Every neighborhood fits in one uint64 word: score all candidates
+        # with a single vectorized AND + popcount
+        adj64 = np.array(adj, dtype=np.uint64)
+        bits64 = np.left_shift(np.uint64(1), np.arange(n, dtype=np.uint64))
+        
+        def pick(candidates: int) -> int:
+            cand = np.uint64(candidates)
+            scores = np.bitwise_count(adj64 & cand).astype(np.int64)
+            scores[(bits64 & cand) == 0] = -1
+            return int(scores.argmax())
+    else:
+        def pick(candidates: int) -> int:
+            best = -1
+            best_score = -1
+            pool = candidates
+            while pool:
+                low = pool & -pool
+                x = low.bit_length() - 1
+                score = (adj[x] & candidates).bit_count()
+                if score > best_score:
+                    best, best_score = x, score
+                pool ^= low
+            return best
     
-    current_clique = set()
+    clique = 0
     
-    for v in vertices:
+    for v in order:
         # Check if v is connected to all vertices in current clique
-        if all(u in graph.get(v, set()) for u in current_clique):
-            current_clique.add(v)
+        if not clique & ~adj[v]:
+            clique |= 1 << v
             
             # Try to extend with remaining candidates
-            candidates = set(graph[v]) - current_clique
+            candidates = adj[v] & ~clique
             
             while candidates:
-                # Pick candidate with max degree
-                best = max(candidates, key=lambda x: len(graph.get(x, set()) & candidates))
+                # Pick candidate with the most neighbors among the candidates
+                best = pick(candidates)
                 
                 # Check if best is connected to all in clique
-                if all(u in graph.get(best, set()) for u in current_clique):
-                    current_clique.add(best)
+                if not clique & ~adj[best]:
+                    clique |= 1 << best
                     # Update candidates
-                    candidates = candidates & graph.get(best, set())
+                    candidates &= adj[best]
                 else:
-                    candidates.remove(best)
+                    candidates &= ~(1 << best)
     
-    return current_clique
+    return from_mask(clique, vertices)
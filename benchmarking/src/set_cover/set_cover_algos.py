@@ -3,14 +3,40 @@ Set Cover Problem Algorithms
 Implements Bruteforce (Exact) and Greedy (ln(n)-Approximation)
 """
 
+import heapq
 import time
 from typing import List, Set, Tuple, Optional
-from itertools import combinations
+
+
+def _to_masks(universe: Set[int], sets: List[Set[int]]) -> Tuple[List[int], int]:
+    """
+    Encode sets as Python int bitmasks over the universe
+    
+    Args:
+        universe: Set of all elements to cover
+        sets: List of sets
+        
+    Returns:
+        (set_masks, universe_mask) where element e of the universe is bit
+        index[e] for a fixed 0..n-1 relabelling; elements outside the universe
+        are dropped since they never count towards a cover
+    """
+    index = {e: i for i, e in enumerate(universe)}
+    set_masks = []
+    for s in sets:
+        mask = 0
+        for e in s:
+            i = index.get(e)
+            if i is not None:
+                mask |= 1 << i
+        set_masks.append(mask)
+    return set_masks, (1 << len(index)) - 1
 
 
 def bruteforce_set_cover(universe: Set[int], sets: List[Set[int]], timeout: float = 60.0) -> Tuple[Optional[List[int]], dict]:
     """
-    Bruteforce Set Cover - tries all combinations from size 1 to m
+    Bruteforce Set Cover - tries combinations from size 1 to m, depth-first
+    with pruning of branches that can no longer cover the universe
     Complexity: O(2^m × n) where m is number of sets
     
     Args:
@@ -21,22 +47,62 @@ def bruteforce_set_cover(universe: Set[int], sets: List[Set[int]], timeout: floa
     Returns:
         (list of set indices, metadata dict)
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    set_masks, universe_mask = _to_masks(universe, sets)
     m = len(sets)
     
-    # Try combinations of increasing size
-    for k in range(1, m + 1):
-        if time.time() - start_time > timeout:
-            return None, {'status': 'TIMEOUT', 'num_sets': 0}
+    # Suffix unions and largest suffix set size: sets idx..m-1 can finish a
+    # cover only if their union fills the gap and k_left of them are big enough
+    tail_union = [0] * (m + 1)
+    tail_largest = [0] * (m + 1)
+    for idx in range(m - 1, -1, -1):
+        tail_union[idx] = tail_union[idx + 1] | set_masks[idx]
+        tail_largest[idx] = max(tail_largest[idx + 1], set_masks[idx].bit_count())
+    
+    check_every = 1 << 12
+    nodes = 0
+    timed_out = False
+    combo = []
+    
+    def search(start: int, k_left: int, covered: int) -> bool:
+        """Extend combo with k_left more sets from start onwards, in lexicographic order"""
+        nonlocal nodes, timed_out
         
-        for combo in combinations(range(m), k):
-            # Check if this combination covers universe
-            covered = set()
-            for idx in combo:
-                covered |= sets[idx]
+        # Only check the clock every check_every nodes
+        nodes += 1
+        if nodes & (check_every - 1) == 0 and time.monotonic() - start_time > timeout:
+            timed_out = True
+        if timed_out:
+            return False
+        
+        if k_left == 0:
+            return covered == universe_mask
+        
+        missing = (universe_mask & ~covered).bit_count()
+        for idx in range(start, m - k_left + 1):
+            # Both bounds only weaken as idx grows, so the first failure ends the loop
+            if covered | tail_union[idx] != universe_mask or k_left * tail_largest[idx] < missing:
+                return False
             
-            if covered >= universe:
-                return list(combo), {'status': 'OPTIMAL', 'num_sets': k, 'coverage': len(covered)}
+            combo.append(idx)
+            if search(idx + 1, k_left - 1, covered | set_masks[idx]):
+                return True
+            combo.pop()
+        
+        return False
+    
+    # No k smaller than |universe| / (largest set) can cover
+    largest = tail_largest[0]
+    first_k = max(1, -(-universe_mask.bit_count() // largest)) if largest else 1
+    
+    # Try combinations of increasing size
+    for k in range(first_k, m + 1):
+        if search(0, k, 0):
+            covered = set().union(*(sets[idx] for idx in combo))
+            return list(combo), {'status': 'OPTIMAL', 'num_sets': k, 'coverage': len(covered)}
+        
+        if timed_out:
+            return None, {'status': 'TIMEOUT', 'num_sets': 0}
     
     return None, {'status': 'INFEASIBLE', 'num_sets': 0}
 
@@ -44,7 +110,7 @@ def bruteforce_set_cover(universe: Set[int], sets: List[Set[int]], timeout: floa
 def greedy_set_cover(universe: Set[int], sets: List[Set[int]], timeout: float = 60.0) -> Tuple[List[int], dict]:
     """
     Greedy Set Cover (ln(n)-Approximation)
-    Complexity: O(m × n)
+    Complexity: O(m × n) worst case; sets are re-scored lazily from a heap
     Approximation Ratio: H(n) ≤ ln(n) + 1
     
     Args:
@@ -56,32 +122,40 @@ def greedy_set_cover(universe: Set[int], sets: List[Set[int]], timeout: float =
         (list of set indices, metadata dict)
     """
     start_time = time.time()
-    uncovered = universe.copy()
+    set_masks, uncovered = _to_masks(universe, sets)
     selected = []
     
+    # Lazy greedy: heap of (-gain, idx) where stored gains may be stale but
+    # never too low, since a set's gain only shrinks as elements get covered
+    heap = [(-mask.bit_count(), idx) for idx, mask in enumerate(set_masks)]
+    heapq.heapify(heap)
+    
     while uncovered:
         if time.time() - start_time > timeout:
-            return selected, {'status': 'TIMEOUT', 'num_sets': len(selected), 'coverage': len(universe) - len(uncovered)}
+            return selected, {'status': 'TIMEOUT', 'num_sets': len(selected), 'coverage': len(universe) - uncovered.bit_count()}
         
-        # Find set covering most uncovered elements
+        # Find set covering most uncovered elements: re-score the top entry
+        # until its stored gain is current, which makes it the true maximum
         best_idx = None
         best_count = 0
         
-        for idx, s in enumerate(sets):
-            if idx not in selected:
-                count = len(s & uncovered)
-                if count > best_count:
-                    best_count = count
-                    best_idx = idx
+        while heap:
+            neg_gain, idx = heapq.heappop(heap)
+            count = (set_masks[idx] & uncovered).bit_count()
+            if count == -neg_gain:
+                best_idx, best_count = idx, count
+                break
+            if count:
+                heapq.heappush(heap, (-count, idx))
         
         if best_idx is None or best_count == 0:
             # Can't cover more
             break
         
         selected.append(best_idx)
-        uncovered -= sets[best_idx]
+        uncovered &= ~set_masks[best_idx]
     
     if uncovered:
-        return selected, {'status': 'PARTIAL', 'num_sets': len(selected), 'coverage': len(universe) - len(uncovered)}
+        return selected, {'status': 'PARTIAL', 'num_sets': len(selected), 'coverage': len(universe) - uncovered.bit_count()}
     
     return selected, {'status': 'COMPLETE', 'num_sets': len(selected), 'coverage': len(universe)}
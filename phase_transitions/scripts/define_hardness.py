@@ -1,33 +1,15 @@
 import time
 import math
-from pysat.solvers import Glucose3
-import random
+from sat_utils import generate_random_3sat, solve
 
 # --- Helper Functions ---
 
-def generate_random_3sat(n_vars, alpha):
-    """Generates a random 3-CNF formula."""
-    n_clauses = int(n_vars * alpha)
-    formula = []
-    variables = list(range(1, n_vars + 1))
-    
-    for _ in range(n_clauses):
-        clause_vars = random.sample(variables, 3)
-        clause = [v * random.choice([-1, 1]) for v in clause_vars]
-        formula.append(clause)
-    return formula
-
 def solve_with_dpll(formula):
     """Runs PySAT (Glucose3) and returns time and conflict count."""
-    with Glucose3(bootstrap_with=formula) as solver:
-        start_time = time.perf_counter()
-        is_sat = solver.solve()
-        end_time = time.perf_counter()
-        
-        stats = solver.accum_stats()
-        conflicts = stats.get('conflicts', 0)
-        
-        return (end_time - start_time), conflicts, is_sat
+    # Always a fresh timed solve: the formulas are unseeded, so a cache would
+    # never hit, and a cached time would come from an earlier run
+    is_sat, stats = solve(formula)
+    return stats['time'], stats['conflicts'], is_sat
 
 def format_clause_to_text(clause):
     """Converts [1, -2, 3] to (x1 ∨ ¬x2 ∨ x3)."""
@@ -60,7 +42,7 @@ small_alpha = 4.26
 print("Generating instances...")
 
 # 1. Generate Big/Easy
-formula_big = generate_random_3sat(big_n, big_alpha)
+formula_big = generate_random_3sat(big_n, int(big_n * big_alpha))
 time_big, conflicts_big, sat_big = solve_with_dpll(formula_big)
 
 # 2. Generate Small/Hard (Search for a good one)
@@ -71,7 +53,7 @@ time_small = 0
 sat_small = False
 
 for i in range(20):
-    temp_formula = generate_random_3sat(small_n, small_alpha)
+    temp_formula = generate_random_3sat(small_n, int(small_n * small_alpha))
     t, c, s = solve_with_dpll(temp_formula)
     
     if c > best_small_conflicts:
@@ -1,26 +1,17 @@
-import random
+from multiprocessing import Pool
+import matplotlib
+matplotlib.use('Agg')  # Batch script: render straight to files, no GUI
 import matplotlib.pyplot as plt
-from pysat.solvers import Glucose3
+from sat_utils import generate_random_3sat, solve_cached, sample_seed
 import numpy as np
 import pandas as pd
 
-def generate_random_3sat(n_vars, n_clauses):
-    variables = list(range(1, n_vars + 1))
-    formula = []
-    for _ in range(n_clauses):
-        clause_vars = random.sample(variables, 3)
-        clause = [v * random.choice([-1, 1]) for v in clause_vars]
-        formula.append(clause)
-    return formula
-
-def measure_conflicts(n_vars, alpha):
+def measure_conflicts(n_vars, alpha, rng=None):
     m = int(n_vars * alpha)
-    formula = generate_random_3sat(n_vars, m)
+    formula = generate_random_3sat(n_vars, m, rng)
     
-    with Glucose3(bootstrap_with=formula) as solver:
-        solver.solve()
-        # The stats are tracked automatically, we just need to fetch them
-        return solver.accum_stats().get('conflicts', 0)
+    # Glucose3 runs only if this exact formula has not been solved before
+    return solve_cached(formula)[1]['conflicts']
 
 # --- CONFIGURATION ---
 N = 75
@@ -28,50 +19,90 @@ SAMPLES = 100 # Samples per point
 # Scan closely around the transition
 alphas = np.arange(3.0, 5.5, 0.1) 
 
-results = []
+def _measure_sample(args):
+    """Seeded sample for the sweep (top-level so Pool workers can run it)."""
+    n_vars, alpha, sample = args
+    rng = np.random.default_rng(sample_seed(n_vars, alpha, sample))
+    return alpha, sample, measure_conflicts(n_vars, alpha, rng)
 
-print(f"Running Volatility Scan (N={N})...")
+def adaptive_conflicts(pool, n_vars, alphas, max_samples=SAMPLES, min_samples=30, step=20, tolerance=0.05):
+    """
+    Conflict counts per alpha, sampled in rounds of `step` until the p99 settles.
 
-for alpha in alphas:
-    conflicts_list = []
-    for i in range(SAMPLES):
-        conflicts_list.append(measure_conflicts(N, alpha))
-    
-    # Calculate Percentiles
-    p50 = np.percentile(conflicts_list, 50) # Median
-    p90 = np.percentile(conflicts_list, 90) # Hard
-    p99 = np.percentile(conflicts_list, 99) # Nightmare
-    
-    results.append({
-        'alpha': alpha,
-        'p50': p50,
-        'p90': p90,
-        'p99': p99
-    })
-    print(f"  alpha={alpha:.1f} | Median={int(p50)} | 99th={int(p99)}")
-
-df = pd.DataFrame(results)
-
-# --- PLOTTING ---
-plt.figure(figsize=(12, 7))
-
-# Plot the lines
-plt.plot(df['alpha'], df['p99'], 'r--', linewidth=2, label='99th Percentile')
-plt.plot(df['alpha'], df['p90'], 'orange', linewidth=2, label='90th Percentile')
-plt.plot(df['alpha'], df['p50'], 'b-', linewidth=2, label='Median')
-
-# Fill the gap to visualize "Volatility"
-plt.fill_between(df['alpha'], df['p50'], df['p99'], color='red', alpha=0.1, label='Zone of Volatility')
-
-plt.axvline(x=4.26, color='k', linestyle=':', alpha=0.5, label='Critical Point')
-
-plt.title(f'The Volatility Explosion: Percentiles of Hardness (N={N})', fontsize=16)
-plt.xlabel('Clause-to-Variable Ratio', fontsize=12)
-plt.ylabel('Conflicts (Deadends)', fontsize=12)
-plt.legend()
-plt.grid(True, linestyle='--', alpha=0.5)
-
-# Save
-plt.savefig('volatility_explosion.png')
-print("Plot saved as 'volatility_explosion.png'")
-plt.show()
\ No newline at end of file
+    Every round solves the next `step` seeded samples of all still-active
+    alphas in the pool. An alpha stops once it has at least `min_samples` and
+    its running p99 moved by less than `tolerance` (relative) at two
+    consecutive checks, or when it reaches `max_samples`. Only the critical
+    region usually needs the full budget.
+
+    Returns:
+        (len(alphas), max_samples) float array, NaN where a sample was skipped
+    """
+    conflicts = np.full((len(alphas), max_samples), np.nan)
+    row = {alpha: k for k, alpha in enumerate(alphas)}
+    last_p99 = [None] * len(alphas)
+    stable_checks = [0] * len(alphas)
+    active = list(range(len(alphas)))
+
+    for start in range(0, max_samples, step):
+        stop = min(start + step, max_samples)
+        tasks = [(n_vars, alphas[k], i) for k in active for i in range(start, stop)]
+        for alpha, sample, count in pool.imap_unordered(_measure_sample, tasks, chunksize=8):
+            conflicts[row[alpha], sample] = count
+
+        still_active = []
+        for k in active:
+            p99_now = np.percentile(conflicts[k, :stop], 99)
+            previous = last_p99[k]
+            if previous is not None and abs(p99_now - previous) < tolerance * max(previous, 1):
+                stable_checks[k] += 1
+            else:
+                stable_checks[k] = 0
+            last_p99[k] = p99_now
+            if stop < min_samples or stable_checks[k] < 2:
+                still_active.append(k)
+        active = still_active
+        if not active:
+            break
+
+    return conflicts
+
+if __name__ == "__main__":
+    print(f"Running Volatility Scan (N={N})...")
+
+    # Every (alpha, sample) solve is independent: spread them over all cores,
+    # stopping each alpha early once its p99 has settled
+    with Pool() as pool:
+        conflicts = adaptive_conflicts(pool, N, alphas)
+    samples_used = np.count_nonzero(~np.isnan(conflicts), axis=1)
+
+    # Median, hard and nightmare percentiles for every alpha in one pass
+    p50, p90, p99 = np.nanpercentile(conflicts, [50, 90, 99], axis=1)
+    for alpha, median, worst, used in zip(alphas, p50, p99, samples_used):
+        print(f"  alpha={alpha:.1f} | Median={int(median)} | 99th={int(worst)} | samples={used}")
+
+    df = pd.DataFrame({'alpha': alphas, 'p50': p50, 'p90': p90, 'p99': p99, 'samples': samples_used})
+
+    # --- PLOTTING ---
+    fig, ax = plt.subplots(figsize=(12, 7))
+
+    # Plot the lines
+    ax.plot(df['alpha'], df['p99'], 'r--', linewidth=2, label='99th Percentile')
+    ax.plot(df['alpha'], df['p90'], 'orange', linewidth=2, label='90th Percentile')
+    ax.plot(df['alpha'], df['p50'], 'b-', linewidth=2, label='Median')
+
+    # Fill the gap to visualize "Volatility"
+    ax.fill_between(df['alpha'], df['p50'], df['p99'], color='red', alpha=0.1, label='Zone of Volatility')
+
+    ax.axvline(x=4.26, color='k', linestyle=':', alpha=0.5, label='Critical Point')
+
+    ax.set_title(f'The Volatility Explosion: Percentiles of Hardness (N={N})', fontsize=16)
+    ax.set_xlabel('Clause-to-Variable Ratio', fontsize=12)
+    ax.set_ylabel('Conflicts (Deadends)', fontsize=12)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.5)
+
+    # Save
+    fig.savefig('volatility_explosion.png')
+    plt.close(fig)
+    print("Plot saved as 'volatility_explosion.png'")
@@ -7,75 +7,94 @@ Generates 3 plots:
 """
 
 import json
+import matplotlib
+matplotlib.use('Agg')  # Batch script: render straight to files, no GUI
 import matplotlib.pyplot as plt
 import pandas as pd
 import os
 
 def load_data(n_val: int) -> pd.DataFrame:
-    """Loads the results JSON file for a specific n."""
+    """
+    Loads the results file for a specific n.
+    Prefers the Parquet copy written by run_experiment.py while it is at least
+    as new as the JSON; otherwise parses the JSON and refreshes the Parquet copy
+    (when pyarrow is installed) for the next run.
+    """
     results_file = f'data/full_experiment_results_n{n_val}.json'
+    parquet_file = os.path.splitext(results_file)[0] + '.parquet'
     
     if not os.path.exists(results_file):
         print(f"Warning: Results file not found at {results_file}")
         print("Please run 'python run_experiment.py' first.")
         return None
     
+    try:
+        if (os.path.exists(parquet_file)
+                and os.path.getmtime(parquet_file) >= os.path.getmtime(results_file)):
+            return pd.read_parquet(parquet_file)
+    except ImportError:
+        pass  # Optional: pip install pyarrow
+
     # Load the main data into a DataFrame
     df = pd.read_json(results_file)
+    try:
+        df.to_parquet(parquet_file)
+    except ImportError:
+        pass
     return df
 
 def plot_task1_comparison(data_dict: dict):
     """
     Plots the P(SAT) 'cliff' for all n values on one graph.
     """
-    plt.figure(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7))
     
     for n, df in data_dict.items():
         # Show datapoints and connect them with a line
-        plt.plot(df['alpha_values'], df['satisfiability_probability'], 
-                 label=f'n = {n}', marker='o', linestyle='-', markersize=6, lw=1.5)
+        ax.plot(df['alpha_values'], df['satisfiability_probability'], 
+                label=f'n = {n}', marker='o', linestyle='-', markersize=6, lw=1.5)
     
-    plt.axvline(x=4.26, color='k', linestyle='--', label='Theoretical Threshold (α ≈ 4.26)')
+    ax.axvline(x=4.26, color='k', linestyle='--', label='Theoretical Threshold (α ≈ 4.26)')
     
-    plt.title('Task 1: Satisfiability vs. Alpha (n=25, 50, 75)', fontsize=16)
-    plt.xlabel('Clause-to-Variable Ratio (α = m/n)', fontsize=12)
-    plt.ylabel('Probability of Satisfiability', fontsize=12)
-    plt.legend(fontsize=11)
-    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.ylim(-0.05, 1.05)
+    ax.set_title('Task 1: Satisfiability vs. Alpha (n=25, 50, 75)', fontsize=16)
+    ax.set_xlabel('Clause-to-Variable Ratio (α = m/n)', fontsize=12)
+    ax.set_ylabel('Probability of Satisfiability', fontsize=12)
+    ax.legend(fontsize=11)
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.set_ylim(-0.05, 1.05)
     
     filename = 'task1_comparison.png'
-    plt.savefig(filename)
+    fig.savefig(filename)
+    plt.close(fig)
     print(f"Task 1 comparison plot saved as '{filename}'")
-    plt.show()
 
 def plot_task2_comparison(data_dict: dict):
     """
     Plots the Difficulty 'spike' for all n values on one graph.
     """
-    plt.figure(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7))
     
     for n, df in data_dict.items():
         # Show datapoints and connect them with a line
-        plt.plot(df['alpha_values'], df['average_conflicts'], 
-                 label=f'n = {n}', marker='s', linestyle='-', markersize=6, lw=1.5)
+        ax.plot(df['alpha_values'], df['average_conflicts'], 
+                label=f'n = {n}', marker='s', linestyle='-', markersize=6, lw=1.5)
     
-    plt.axvline(x=4.26, color='k', linestyle='--', label='Theoretical Threshold (α ≈ 4.26)')
+    ax.axvline(x=4.26, color='k', linestyle='--', label='Theoretical Threshold (α ≈ 4.26)')
     
-    plt.title('Task 2: Computational Difficulty vs. Alpha (n=25, 50, 75)', fontsize=16)
-    plt.xlabel('Clause-to-Variable Ratio (α = m/n)', fontsize=12)
-    plt.ylabel('Average Conflicts ("Deadends")', fontsize=12)
+    ax.set_title('Task 2: Computational Difficulty vs. Alpha (n=25, 50, 75)', fontsize=16)
+    ax.set_xlabel('Clause-to-Variable Ratio (α = m/n)', fontsize=12)
+    ax.set_ylabel('Average Conflicts ("Deadends")', fontsize=12)
     
     # Use a log scale on Y-axis to see all spikes
-    plt.yscale('log')
+    ax.set_yscale('log')
     
-    plt.legend(fontsize=11)
-    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.legend(fontsize=11)
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
     
     filename = 'task2_comparison.png'
-    plt.savefig(filename)
+    fig.savefig(filename)
+    plt.close(fig)
     print(f"Task 2 comparison plot saved as '{filename}'")
-    plt.show()
 
 def plot_n75_combined(df_75: pd.DataFrame):
     """
@@ -115,13 +134,13 @@ def plot_n75_combined(df_75: pd.DataFrame):
     lines2, labels2 = ax2.get_legend_handles_labels()
     ax2.legend(lines + lines2, labels + labels2, loc='upper center')
 
-    plt.title('Combined P(SAT) and Difficulty for n=75', fontsize=16)
+    ax1.set_title('Combined P(SAT) and Difficulty for n=75', fontsize=16)
     fig.tight_layout()  # Adjust plot to prevent label overlap
     
     filename = 'n75_combined.png'
-    plt.savefig(filename)
+    fig.savefig(filename)
+    plt.close(fig)
     print(f"n=75 combined plot saved as '{filename}'")
-    plt.show()
 
 if __name__ == "__main__":
     n_values_to_plot = [25, 50, 75]
@@ -1,60 +1,59 @@
-import random
+from multiprocessing import Pool
+import matplotlib
+matplotlib.use('Agg')  # Batch script: render straight to files, no GUI
 import matplotlib.pyplot as plt
-from pysat.solvers import Glucose3
+from sat_utils import generate_random_3sat, solve_cached, sample_seed
 import numpy as np
 
-def generate_random_3sat(n_vars, n_clauses):
-    variables = list(range(1, n_vars + 1))
-    formula = []
-    for _ in range(n_clauses):
-        clause_vars = random.sample(variables, 3)
-        clause = [v * random.choice([-1, 1]) for v in clause_vars]
-        formula.append(clause)
-    return formula
-
-def measure_conflicts(n_vars, alpha):
+def measure_conflicts(n_vars, alpha, rng=None):
     m = int(n_vars * alpha)
-    formula = generate_random_3sat(n_vars, m)
+    formula = generate_random_3sat(n_vars, m, rng)
     
-    with Glucose3(bootstrap_with=formula) as solver:
-        solver.solve()
-        stats = solver.accum_stats()
-        return stats.get('conflicts', 0)
+    return solve_cached(formula)[1]['conflicts']
 
 # --- CONFIGURATION ---
 N = 75
 ALPHA = 3.8
 TRIALS = 1000 # High sample size for a smooth histogram
 
-print(f"Running Distribution Analysis: N={N}, Alpha={ALPHA}, Trials={TRIALS}...")
-
-conflicts_data = []
-for i in range(TRIALS):
-    c = measure_conflicts(N, ALPHA)
-    conflicts_data.append(c)
-    if (i+1) % 50 == 0:
-        print(f"  Completed {i+1}/{TRIALS}...", end='\r')
-
-# --- PLOTTING ---
-plt.figure(figsize=(10, 6))
-
-# Histogram with log scale on y-axis to show the tail
-counts, bins, patches = plt.hist(conflicts_data, bins=50, color='purple', edgecolor='black', alpha=0.7, log=True)
-
-# Add Mean and Median lines
-mean_val = np.mean(conflicts_data)
-median_val = np.median(conflicts_data)
-
-plt.axvline(mean_val, color='red', linestyle='dashed', linewidth=2, label=f'Mean ({int(mean_val)})')
-plt.axvline(median_val, color='yellow', linestyle='dashed', linewidth=2, label=f'Median ({int(median_val)})')
-
-plt.title(f'Evidence of Computational Chaos: Distribution of Hardness (N={N})', fontsize=14)
-plt.xlabel('Computational Cost (Conflicts)', fontsize=12)
-plt.ylabel('Frequency (Log Scale)', fontsize=12)
-plt.legend()
-plt.grid(True, which="both", ls="--", alpha=0.3)
-
-filename = "heavy_tail_distribution.png"
-plt.savefig(filename)
-print(f"\nPlot saved as '{filename}'")
-plt.show()
\ No newline at end of file
+def _measure_sample(args):
+    """Seeded trial (top-level so Pool workers can run it)."""
+    n_vars, alpha, sample = args
+    rng = np.random.default_rng(sample_seed(n_vars, alpha, sample))
+    return measure_conflicts(n_vars, alpha, rng)
+
+if __name__ == "__main__":
+    print(f"Running Distribution Analysis: N={N}, Alpha={ALPHA}, Trials={TRIALS}...")
+
+    # Trials are independent: spread them over all cores
+    conflicts_data = []
+    with Pool() as pool:
+        tasks = [(N, ALPHA, i) for i in range(TRIALS)]
+        for c in pool.imap_unordered(_measure_sample, tasks, chunksize=8):
+            conflicts_data.append(c)
+            if len(conflicts_data) % 50 == 0:
+                print(f"  Completed {len(conflicts_data)}/{TRIALS}...", end='\r')
+
+    # --- PLOTTING ---
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Histogram with log scale on y-axis to show the tail
+    counts, bins, patches = ax.hist(conflicts_data, bins=50, color='purple', edgecolor='black', alpha=0.7, log=True)
+
+    # Add Mean and Median lines
+    mean_val = np.mean(conflicts_data)
+    median_val = np.median(conflicts_data)
+
+    ax.axvline(mean_val, color='red', linestyle='dashed', linewidth=2, label=f'Mean ({int(mean_val)})')
+    ax.axvline(median_val, color='yellow', linestyle='dashed', linewidth=2, label=f'Median ({int(median_val)})')
+
+    ax.set_title(f'Evidence of Computational Chaos: Distribution of Hardness (N={N})', fontsize=14)
+    ax.set_xlabel('Computational Cost (Conflicts)', fontsize=12)
+    ax.set_ylabel('Frequency (Log Scale)', fontsize=12)
+    ax.legend()
+    ax.grid(True, which="both", ls="--", alpha=0.3)
+
+    filename = "heavy_tail_distribution.png"
+    fig.savefig(filename)
+    plt.close(fig)
+    print(f"\nPlot saved as '{filename}'")
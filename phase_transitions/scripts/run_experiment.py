@@ -4,91 +4,96 @@ Captures BOTH P(SAT) and Difficulty (Conflicts)
 (Corrected Version 2)
 """
 
-import random
 import numpy as np
+import pandas as pd
 import json
 import os
 import time
-from pysat.solvers import Glucose3 # Using a fast, standard solver
+from collections import defaultdict
+from multiprocessing import Pool
+from sat_utils import generate_random_3sat, solve_cached, sample_seed # Glucose3, skipped for formulas solved before
 
-def generate_random_formula(n_vars: int, n_clauses: int) -> list:
-    """
-    Generates a random 3-CNF formula.
-    (This function is unchanged)
-    """
-    variables = list(range(1, n_vars + 1))
-    formula = []
-    
-    for _ in range(n_clauses):
-        clause_vars = random.sample(variables, 3)
-        clause = [
-            var * random.choice([-1, 1]) 
-            for var in clause_vars
-        ]
-        formula.append(clause)
-        
-    return formula
+def _solve_one(args: tuple) -> tuple:
+    """Generates and solves one seeded sample (top-level so Pool workers can run it)."""
+    n_vars, alpha, sample = args
+    rng = np.random.default_rng(sample_seed(n_vars, alpha, sample))
+    formula = generate_random_3sat(n_vars, int(alpha * n_vars), rng)
+    is_sat, stats = solve_cached(formula)
+    return n_vars, alpha, stats['conflicts'], is_sat
 
-def run_experiment(alpha_values: list, n_vars: int, samples_per_alpha: int) -> dict:
+def run_experiment(alpha_values: list, n_values: list, samples_per_alpha: int, processes: int = None) -> dict:
     """
-    Runs the full experiment for BOTH tasks.
+    Runs the full experiment for BOTH tasks, for every n at once.
+    Samples are independent, so every (n, alpha, sample) triple goes into one
+    worker pool: the hard alphas of the largest n no longer leave cores idle
+    while the other sweeps wait their turn.
+    
+    Returns:
+        Dictionary mapping each n to its results dictionary
     """
     
-    print(f"Starting Full Experiment: n={n_vars}, samples/alpha={samples_per_alpha}")
+    print(f"Starting Full Experiment: n={list(n_values)}, samples/alpha={samples_per_alpha}")
     print("=" * 60)
     
-    results = {
-        'n_variables': n_vars,
-        'samples_per_alpha': samples_per_alpha,
-        'alpha_values': [],
-        'satisfiability_probability': [],
-        'average_conflicts': []
-    }
+    tasks = [(n_vars, alpha, i) for n_vars in n_values for alpha in alpha_values for i in range(samples_per_alpha)]
+    satisfiable_count = defaultdict(lambda: defaultdict(int))
+    conflict_counts = defaultdict(lambda: defaultdict(list))
+    start_time = time.time()
     
-    for alpha in alpha_values:
-        m_clauses = int(alpha * n_vars)
-        satisfiable_count = 0
-        conflict_counts = []
-        
-        print(f"\n[Testing α = {alpha:.2f}] (n={n_vars}, m={m_clauses})")
-        start_time = time.time()
+    with Pool(processes) as pool:
+        for done, (n_vars, alpha, conflicts, is_sat) in enumerate(pool.imap_unordered(_solve_one, tasks, chunksize=4), 1):
+            if is_sat:
+                satisfiable_count[n_vars][alpha] += 1
+            conflict_counts[n_vars][alpha].append(conflicts)
+            
+            if done % 100 == 0:
+                print(f"  ... completed {done}/{len(tasks)}", end='\r')
+    print()
+    
+    all_results = {}
+    for n_vars in n_values:
+        results = {
+            'n_variables': n_vars,
+            'samples_per_alpha': samples_per_alpha,
+            'alpha_values': [],
+            'satisfiability_probability': [],
+            'average_conflicts': []
+        }
         
-        for i in range(samples_per_alpha):
-            formula = generate_random_formula(n_vars, m_clauses)
+        for alpha in alpha_values:
+            m_clauses = int(alpha * n_vars)
+            prob = satisfiable_count[n_vars][alpha] / samples_per_alpha
+            avg_conflicts = np.mean(conflict_counts[n_vars][alpha])
             
-            with Glucose3(bootstrap_with=formula) as solver:
-                is_sat = solver.solve()
-                if is_sat:
-                    satisfiable_count += 1
-                
-                # Get solver statistics (conflicts, decisions, etc.)
-                stats = solver.accum_stats()
-                conflicts = stats.get('conflicts', 0)
-                conflict_counts.append(conflicts)
+            results['alpha_values'].append(alpha)
+            results['satisfiability_probability'].append(prob)
+            results['average_conflicts'].append(avg_conflicts)
             
-            if (i + 1) % 20 == 0:
-                print(f"  ... completed {i+1}/{samples_per_alpha}", end='\r')
-        
-        prob = satisfiable_count / samples_per_alpha
-        avg_conflicts = np.mean(conflict_counts)
+            print(f"[α = {alpha:.2f}] (n={n_vars}, m={m_clauses}) -> P(SAT) = {prob:.3f} | Avg. Conflicts = {avg_conflicts:.2f}")
         
-        results['alpha_values'].append(alpha)
-        results['satisfiability_probability'].append(prob)
-        results['average_conflicts'].append(avg_conflicts)
-        
-        end_time = time.time()
-        print(f"  -> P(SAT) = {prob:.3f} | Avg. Conflicts = {avg_conflicts:.2f} (in {end_time - start_time:.2f}s)")
+        all_results[n_vars] = results
+    
+    print(f"Solved {len(tasks)} formulas in {time.time() - start_time:.2f}s")
 
     print("\n" + "=" * 60)
     print("Experiment finished.")
-    return results
+    return all_results
 
 def save_results(results: dict, filename: str):
-    """Saves the results dictionary to a JSON file."""
+    """
+    Saves the results dictionary to a JSON file.
+    A Parquet copy with the same columns is written next to it when pyarrow is
+    installed, so replotting can skip JSON parsing.
+    """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     with open(filename, 'w') as f:
         json.dump(results, f, indent=2)
     print(f"Results saved to {filename}")
+    
+    try:
+        pd.DataFrame(results).to_parquet(os.path.splitext(filename)[0] + '.parquet')
+    except ImportError:
+        pass  # Optional: pip install pyarrow
 
 if __name__ == "__main__":
     # --- Experiment Parameters ---
@@ -104,10 +109,9 @@ if __name__ == "__main__":
     alpha_values.extend(np.arange(6.0, 8.5, 0.5))
     alpha_values = sorted(list(set([round(a, 2) for a in alpha_values])))
 
-    # Run experiments for each n and save to a per-n JSON file
-    for n in N_VALUES:
-        print(f"\n=== Running experiments for n={n} (samples/alpha={SAMPLES_PER_ALPHA}) ===")
-        results = run_experiment(alpha_values, n, SAMPLES_PER_ALPHA)
+    # Run the sweeps for all n values together, then save a per-n JSON file
+    all_results = run_experiment(alpha_values, N_VALUES, SAMPLES_PER_ALPHA)
+    for n, results in all_results.items():
         out_file = os.path.join(RESULTS_DIR, f'full_experiment_results_n{n}.json')
         save_results(results, out_file)
 
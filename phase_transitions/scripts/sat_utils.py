@@ -0,0 +1,138 @@
+"""
+Shared helpers for the phase transition scripts
+Random 3-SAT generation and a persistent cache of Glucose3 results, keyed by formula
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pysat.solvers import Glucose3
+
+# Override with the SAT_CACHE environment variable; set it to '' to disable
+CACHE_PATH = os.environ.get(
+    'SAT_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'sat_cache.sqlite')
+)
+
+_connection = None
+_connection_pid = None
+
+
+def _cache():
+    """Open the cache database once per process (connections must not cross a fork)."""
+    global _connection, _connection_pid
+    if not CACHE_PATH:
+        return None
+    if _connection is None or _connection_pid != os.getpid():
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        # Generous timeout so parallel workers wait for each other's writes
+        _connection = sqlite3.connect(CACHE_PATH, timeout=60.0)
+        # WAL lets readers proceed during writes; a lost tail of cached results
+        # after a crash is harmless, so skip the per-commit fsync
+        _connection.execute('PRAGMA journal_mode=WAL')
+        _connection.execute('PRAGMA synchronous=OFF')
+        _connection.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(key TEXT PRIMARY KEY, sat INTEGER, conflicts INTEGER, decisions INTEGER, time REAL)'
+        )
+        _connection_pid = os.getpid()
+    return _connection
+
+
+def sample_seed(n_vars: int, alpha: float, sample: int) -> Tuple[int, int, int]:
+    """Deterministic seed for one sample of a sweep, so reruns regenerate (and hit) the same formulas."""
+    return n_vars, round(alpha * 100), sample
+
+
+def generate_random_3sat(n_vars: int, n_clauses: int, rng: Optional[np.random.Generator] = None) -> List[List[int]]:
+    """
+    Generates a random 3-CNF formula: each clause has 3 distinct variables, each negated with probability 1/2.
+
+    All clauses are drawn in a few vectorized calls. The three distinct variables
+    come from shrinking ranges (n, n-1, n-2) shifted past the values already
+    taken, which is uniform over ordered triples without any rejection step.
+    """
+    if n_vars < 3 and n_clauses > 0:
+        raise ValueError("A 3-SAT clause needs at least 3 variables")
+    if rng is None:
+        rng = np.random.default_rng()
+
+    a = rng.integers(0, n_vars, n_clauses)
+    b = rng.integers(0, n_vars - 1, n_clauses)
+    c = rng.integers(0, n_vars - 2, n_clauses)
+    b += b >= a
+    low, high = np.minimum(a, b), np.maximum(a, b)
+    c += c >= low
+    c += c >= high
+
+    variables = np.stack([a, b, c], axis=1) + 1
+    signs = rng.integers(0, 2, (n_clauses, 3)) * 2 - 1
+    return (variables * signs).tolist()
+
+
+def formula_key(formula: List[List[int]]) -> str:
+    """Canonical hash of a CNF formula: independent of clause and literal order."""
+    canonical = sorted(tuple(sorted(clause)) for clause in formula)
+    return hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+
+
+def solve(formula: List[List[int]]) -> Tuple[bool, dict]:
+    """
+    Solve a formula with a fresh Glucose3, bypassing the cache.
+
+    Returns:
+        Tuple of (is_satisfiable, stats) where stats has 'conflicts', 'decisions'
+        and 'time' (solve time in seconds, measured by this call)
+    """
+    # A fresh solver per formula on purpose: Glucose cannot drop clauses, and a
+    # reused instance (selector literals + assumptions) would carry learnt
+    # clauses and variable activities over, skewing the conflict counts being
+    # measured. Building the solver is ~10% of a solve at n=100, alpha=4.3.
+    with Glucose3(bootstrap_with=formula) as solver:
+        start_time = time.perf_counter()
+        is_sat = solver.solve()
+        elapsed = time.perf_counter() - start_time
+
+        solver_stats = solver.accum_stats() or {}
+        return is_sat, {
+            'conflicts': solver_stats.get('conflicts', 0),
+            'decisions': solver_stats.get('decisions', 0),
+            'time': elapsed
+        }
+
+
+def solve_cached(formula: List[List[int]]) -> Tuple[bool, dict]:
+    """
+    Solve a formula with Glucose3, reusing the stored result if it was solved before.
+
+    Meant for seeded sweeps that rerun the same formulas; callers that report
+    solve times, or whose formulas are never regenerated, should use solve().
+
+    Returns:
+        Tuple of (is_satisfiable, stats) where stats has 'conflicts', 'decisions'
+        and 'time' (solve time in seconds, as measured when first solved)
+    """
+    db = _cache()
+    key = formula_key(formula)
+
+    if db is not None:
+        row = db.execute(
+            'SELECT sat, conflicts, decisions, time FROM results WHERE key = ?', (key,)
+        ).fetchone()
+        if row is not None:
+            return bool(row[0]), {'conflicts': row[1], 'decisions': row[2], 'time': row[3]}
+
+    is_sat, stats = solve(formula)
+
+    if db is not None:
+        with db:
+            db.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                (key, int(is_sat), stats['conflicts'], stats['decisions'], stats['time'])
+            )
+
+    return is_sat, stats
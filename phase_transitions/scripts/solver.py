@@ -2,34 +2,30 @@
 3SAT Solver (PySAT-based) and Instance Generator
 """
 
-import random
 from typing import List, Tuple, Dict
+
+import numpy as np
+import sat_utils
 from pysat.solvers import Glucose3  # Import the fast C++ solver
 
-class Clause:
-    """Represents a clause with exactly three literals."""
-    
-    def __init__(self, literals: Tuple[int, int, int]):
-        if len(literals) != 3:
-            raise ValueError("A clause must have exactly 3 literals")
-        # Store as a list for PySAT
-        self.literals = list(literals) 
-    
-    def __repr__(self):
-        return f"({self.literals[0]} ∨ {self.literals[1]} ∨ {self.literals[2]})"
+# A clause is a plain tuple of three literals, already in the form PySAT takes
+Clause = tuple
 
 
 class ThreeSAT:
     """Represents a 3SAT instance, solvable with PySAT."""
     
     def __init__(self, n_variables: int, clauses: List[Clause]):
+        if any(len(clause) != 3 for clause in clauses):
+            raise ValueError("A clause must have exactly 3 literals")
+        
         self.n_variables = n_variables
         self.clauses = clauses
         self.m = len(clauses)
         self.alpha = self.m / self.n_variables if self.n_variables > 0 else 0
         
-        # This is the format PySAT needs: a list of lists
-        self.cnf_clauses = [c.literals for c in clauses]
+        # PySAT accepts the tuples as they are, so no converted copy is kept
+        self.cnf_clauses = clauses
     
     def is_satisfiable(self) -> Tuple[bool, dict]:
         """
@@ -58,19 +54,7 @@ class ThreeSAT:
 
 def generate_random_3sat(n_variables: int, m_clauses: int, seed: int = None) -> ThreeSAT:
     """
-    Generate a random 3SAT instance. (This is your code, it's perfect).
+    Generate a random 3SAT instance with the shared sat_utils generator.
     """
-    if seed is not None:
-        random.seed(seed)
-    
-    clauses = []
-    
-    for _ in range(m_clauses):
-        variables = random.sample(range(1, n_variables + 1), 3)
-        literals = tuple(
-            var if random.random() > 0.5 else -var
-            for var in variables
-        )
-        clauses.append(Clause(literals))
-    
-    return ThreeSAT(n_variables, clauses)
\ No newline at end of file
+    formula = sat_utils.generate_random_3sat(n_variables, m_clauses, np.random.default_rng(seed))
+    return ThreeSAT(n_variables, [Clause(clause) for clause in formula])